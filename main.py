@@ -4,11 +4,11 @@ import json
 import time
 import argparse
 import configparser
+from functools import partial
 from termcolor import colored
 from datetime import *
 from nuclei_utils import run_nuclei_scans
-from openvas_utils import openvas_scan, update_nvt, update_scap, update_cert
-from report_utils import generate_report
+from openvas_utils import openvas_scan, update_all_feeds, gmp_session, get_connection_timeout
 from config_utils import update_config_file
 from nikto_utils import run_nikto_scans
 from exploit_module import *
@@ -26,7 +26,7 @@ def main():
     - Updates the configuration file with provided arguments.
     - Runs Nuclei scans and updates.
     - Runs Nikto scans.
-    - Updates the Greenbone Vulnerability Manager (GVM) feeds.
+    - Updates the Greenbone Vulnerability Manager (GVM) feeds concurrently.
     - Executes the OpenVAS scan and generates a report based on the scan results.
 
     Command-line Arguments:
@@ -141,33 +141,37 @@ def main():
         nikto_target_dir="nikto_results", nikto_target_file="targets.txt"
     )
 
-    # Update Greenbone Vulnerability Manager feeds
-    update_nvt()
-    update_scap()
-    update_cert()
+    # Update Greenbone Vulnerability Manager feeds concurrently
+    update_all_feeds()
 
-    # Run OpenVAS scan and get the path to the generated CSV report and task details
-    (
-        csv_path,
-        task_name,
-        hosts_count,
-        high_count,
-        medium_count,
-        low_count,
-        os_count,
-        apps_count,
-    ) = openvas_scan(
-        path,
-        username,
-        password,
-        target_name,
-        target_ip,
-        port_list_name,
-        task_name,
-        scan_config,
-        scanner,
+    # Open a GMP session that can be shared by scans, with a factory for additional sessions
+    connect = partial(
+        gmp_session, path, username, password, get_connection_timeout(target_ip)
     )
 
+    # Run OpenVAS scan and get the path to the generated CSV report and task details
+    with connect() as gmp:
+        (
+            csv_path,
+            task_name,
+            hosts_count,
+            high_count,
+            medium_count,
+            low_count,
+            os_count,
+            apps_count,
+        ) = openvas_scan(
+            gmp,
+            target_name,
+            target_ip,
+            port_list_name,
+            task_name,
+            scan_config,
+            scanner,
+            connect=connect,
+            reauthenticate=partial(gmp.authenticate, username, password),
+        )
+
     # Run the Exploitation Module with the obtained csv_path
     if csv_path:
         exploitedcves, incompatiblecves, reportname = run_exploit_module(
@@ -191,6 +195,9 @@ def main():
 
     # Generate the report using the generated CSV report path and Nikto CSV path
     if csv_path:
+        # Imported here so pandas, matplotlib and reportlab are only loaded when a report is generated
+        from report_utils import generate_report
+
         generate_report(
             csv_path,
             task_name,
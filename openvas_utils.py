@@ -1,13 +1,24 @@
 import os
+import sys
+import re
 import csv
 import time
 import json
+import shutil
 import subprocess
-import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from termcolor import colored
+from lxml import etree
 from gvm.connections import UnixSocketConnection
 from gvm.protocols.latest import Gmp
-from gvm.errors import GvmError
+from gvm.errors import (
+    GvmError,
+    GvmClientError,
+    InvalidArgument,
+    InvalidArgumentType,
+    RequiredArgument,
+)
 from pathlib import Path
 from base64 import b64decode
 from logger import logger
@@ -15,6 +26,335 @@ from logger import logger
 
 print_timestamp = time.strftime("%d-%m-%Y %H:%M:%S")
 
+# Matches the UUID in the id attribute of a create_* response root element
+_ID_RX = re.compile(r'\sid="([0-9a-f-]{36})"')
+# Matches the report ID in a start_task response
+_REPORT_ID_RX = re.compile(r"<report_id>([^<]+)</report_id>")
+# Matches the task status in a get_tasks response
+_STATUS_RX = re.compile(r"<status>([^<]+)</status>")
+
+# Task states in which a scan has finished
+FINISHED_TASK_STATES = ("Done", "Stopped", "Failed")
+
+# Initial and maximum delay (in seconds) between task status polls
+POLL_DELAY_START = 2.0
+POLL_DELAY_MAX = 30.0
+
+# Compiled XPath expressions for the report summary, relative to the get_reports_response root.
+# Explicit paths avoid a descendant scan over the whole report
+_XP_HOSTS_COUNT = etree.XPath("report/report/hosts/count/text()")
+_XP_OS_COUNT = etree.XPath("report/report/os/count/text()")
+_XP_APPS_COUNT = etree.XPath("report/report/apps/count/text()")
+# Filtered result count of every severity bucket, selected in a single evaluation
+_XP_SEVERITY_FILTERED = etree.XPath(
+    "report/report/result_count/*[self::high or self::medium or self::low"
+    " or self::hole or self::warning or self::info]/filtered"
+)
+
+# Number of attempts (with exponential backoff) for GMP requests that may fail transiently
+GMP_RETRY_ATTEMPTS = 5
+# Task states in which a newly created task can be started
+READY_TASK_STATES = ("New", "Requested")
+
+# Directory the downloaded OpenVAS reports are written to
+OPENVAS_REPORTS_DIR = Path("openvas_reports")
+
+# Report format IDs used when downloading reports
+XML_REPORT_FORMAT_ID = "a994b278-1f62-11e1-96ac-406186ea4fc5"
+PDF_REPORT_FORMAT_ID = "c402cc3e-b531-11e1-9163-406186ea4fc5"
+CSV_REPORT_FORMAT_ID = "c1645568-627a-11e3-a660-406186ea4fc5"
+
+# Report filter for the summary request: no result rows, only the high/medium/low counts.
+# Overrides are not applied so the counts match the original threat levels of the results.
+SUMMARY_FILTER = "apply_overrides=0 levels=hml first=1 rows=0"
+
+
+def extract_response_id(response):
+    """
+    Extract the resource ID from a small GMP create_* response.
+
+    The ID is read with a regex on the raw response, only falling back to a full
+    XML parse if the regex does not match.
+
+    Args:
+        response (str): Raw XML response returned by GMP.
+
+    Returns:
+        str: The ID of the created resource, or None if it could not be found.
+    """
+    match = _ID_RX.search(response)
+    if match:
+        return match.group(1)
+    return etree.fromstring(response).get("id")
+
+
+def extract_report_id(response):
+    """
+    Extract the report ID from a start_task response.
+
+    Args:
+        response (str): The XML response returned by GMP for start_task.
+
+    Returns:
+        str: The ID of the report created for the started task.
+    """
+    match = _REPORT_ID_RX.search(response)
+    if match:
+        return match.group(1)
+    # Fall back to parsing the response if the fast path does not match
+    return etree.fromstring(response).findtext("report_id")
+
+
+def huge_parser():
+    """
+    Create an XML parser that accepts the very large text nodes found in downloaded reports.
+
+    Returns:
+        XMLParser: A new lxml parser with huge_tree enabled.
+    """
+    return etree.XMLParser(huge_tree=True)
+
+
+def get_count_value(element, xpath):
+    """
+    Helper function to extract count values from XML.
+
+    Args:
+        element (Element): XML element to evaluate the XPath against.
+        xpath (XPath): Compiled XPath selecting the text of the desired count element.
+
+    Returns:
+        int: The count value extracted from the XML, or 0 if the element is missing.
+    """
+    values = xpath(element) if element is not None else []
+    if not values or not values[0].strip():
+        return 0
+    return int(values[0])
+
+
+def summarise_report(xml_report):
+    """
+    Read the host, OS and application counts and the vulnerability counts by severity from a report summary.
+
+    The report is expected to have been requested without details, so it only carries the
+    summary blocks and the per-severity result counts rather than every result.
+
+    Args:
+        xml_report (str): The XML report summary returned by GMP.
+
+    Returns:
+        dict: Counts keyed by "hosts", "os", "apps", "High", "Medium" and "Low".
+    """
+    rep_xml = etree.fromstring(xml_report)
+    # Map each severity bucket name to its filtered count
+    filtered_counts = {
+        filtered.getparent().tag: int(filtered.text or 0)
+        for filtered in _XP_SEVERITY_FILTERED(rep_xml)
+    }
+
+    summary = {
+        "hosts": get_count_value(rep_xml, _XP_HOSTS_COUNT),
+        "os": get_count_value(rep_xml, _XP_OS_COUNT),
+        "apps": get_count_value(rep_xml, _XP_APPS_COUNT),
+    }
+    # Older GMP versions name the severity buckets hole/warning/info
+    for severity, legacy_name in (("High", "hole"), ("Medium", "warning"), ("Low", "info")):
+        bucket = severity.lower()
+        summary[severity] = filtered_counts.get(bucket, filtered_counts.get(legacy_name, 0))
+
+    return summary
+
+
+def get_task_status(gmp, task_id):
+    """
+    Get the current status of a task.
+
+    Args:
+        gmp (Gmp): An authenticated GMP session.
+        task_id (str): ID of the task.
+
+    Returns:
+        str: The task status (e.g. "New", "Running", "Done"), or None if the response has no status.
+    """
+    # Request the task without details so the response only carries its status
+    task_response = gmp.get_tasks(filter_string=f"uuid={task_id}", details=False)
+    status_match = _STATUS_RX.search(task_response)
+    return status_match.group(1) if status_match else None
+
+
+def wait_for_task_ready(gmp, task_id, attempts=GMP_RETRY_ATTEMPTS):
+    """
+    Wait until a newly created task can be started.
+
+    The task is normally ready straight away, so the status is checked immediately and
+    only re-checked with a short backoff if it is not yet in a startable state.
+
+    Args:
+        gmp (Gmp): An authenticated GMP session.
+        task_id (str): ID of the task.
+        attempts (int): Number of status checks before giving up.
+
+    Returns:
+        bool: True if the task is ready to be started, False otherwise.
+    """
+    for attempt in range(attempts):
+        if get_task_status(gmp, task_id) in READY_TASK_STATES:
+            return True
+        time.sleep(0.5 * 2 ** attempt)
+    return False
+
+
+def is_transient_gmp_error(error):
+    """
+    Check whether a GMP error is worth retrying.
+
+    Connection drops and timeouts are transient. Errors caused by the request itself,
+    such as invalid arguments or a rejected command, are not.
+
+    Args:
+        error (Exception): The error raised by the GMP call.
+
+    Returns:
+        bool: True if the call may succeed when retried.
+    """
+    if isinstance(error, (GvmClientError, InvalidArgument, InvalidArgumentType, RequiredArgument)):
+        return False
+    return isinstance(error, (GvmError, OSError))
+
+
+def call_with_retry(func, *args, reauthenticate=None, attempts=GMP_RETRY_ATTEMPTS, **kwargs):
+    """
+    Call a GMP function, retrying with exponential backoff on transient errors.
+
+    python-gvm closes the connection when a request fails and reconnects on the next
+    request, so the session only has to be re-authenticated before retrying.
+
+    Args:
+        func (callable): The GMP method or helper to call.
+        *args: Positional arguments passed on to func.
+        reauthenticate (callable, optional): Re-authenticates the GMP session after a failure.
+        attempts (int): Number of attempts before the last error is raised.
+        **kwargs: Keyword arguments passed on to func.
+
+    Returns:
+        The return value of func.
+
+    Raises:
+        GvmError: If the error is not transient or every attempt fails.
+    """
+    for attempt in range(attempts):
+        try:
+            return func(*args, **kwargs)
+        except (GvmError, OSError) as e:
+            if attempt == attempts - 1 or not is_transient_gmp_error(e):
+                raise
+            logger.warning(f"GMP request failed, retrying: {e}")
+            time.sleep(2 ** attempt)
+            if reauthenticate is not None:
+                try:
+                    reauthenticate()
+                except (GvmError, OSError) as reconnect_error:
+                    logger.warning(f"Reconnecting to GVM failed: {reconnect_error}")
+
+
+def report_content(report_response):
+    """
+    Extract the base64-encoded report content from a get_report response.
+
+    The content is the text between the closing report_format tag and the closing report tag.
+    It is sliced out of the response directly, so the multi-megabyte payload is not run
+    through the XML parser. Responses that do not have the expected layout are parsed instead.
+
+    Args:
+        report_response (str): The XML response returned by GMP for a PDF or CSV report.
+
+    Returns:
+        str: The base64-encoded report content, or None if the response carries no content.
+    """
+    start = report_response.find("</report_format>")
+    end = report_response.find("</report>", start) if start != -1 else -1
+    if end != -1:
+        return report_response[start + len("</report_format>") : end].strip() or None
+
+    # Fall back to parsing the response
+    report_element = etree.fromstring(report_response, huge_parser()).find("report")
+    if report_element is None:
+        return None
+    report_format = report_element.find("report_format")
+    if report_format is None or not report_format.tail:
+        return None
+    return report_format.tail.strip() or None
+
+
+def write_base64_file(content, file_path, chunk_size=64 * 1024):
+    """
+    Decode base64 content and write it to a file chunk by chunk.
+
+    Decoding in chunks avoids holding a second, decoded copy of the whole report in memory.
+    GVM returns the report content as a single unbroken base64 string, so chunks are cut on
+    4-character boundaries and each decodes independently.
+
+    Args:
+        content (str): The base64-encoded content.
+        file_path (Path): Path of the file to write.
+        chunk_size (int): Number of base64 characters decoded per write, a multiple of 4.
+    """
+    with open(file_path, "wb") as file:
+        for start in range(0, len(content), chunk_size):
+            file.write(b64decode(content[start : start + chunk_size]))
+
+
+def fetch_report_content(gmp, report_id, report_format_id, attempts=3, reauthenticate=None):
+    """
+    Download a report in the given format.
+
+    The request is retried with a short backoff if GVM returns a report without content.
+
+    Args:
+        gmp (Gmp): An authenticated GMP session.
+        report_id (str): ID of the report to download.
+        report_format_id (str): ID of the report format to download.
+        attempts (int): Number of times to request the report before giving up.
+        reauthenticate (callable, optional): Re-authenticates the GMP session after a failure.
+
+    Returns:
+        str: The base64-encoded report content, or None if no content was returned.
+    """
+    for attempt in range(attempts):
+        content = report_content(
+            call_with_retry(
+                gmp.get_report,
+                reauthenticate=reauthenticate,
+                report_id=report_id,
+                report_format_id=report_format_id,
+                ignore_pagination=True,
+                details=True,
+            )
+        )
+        if content:
+            return content
+        time.sleep(0.5 * 2 ** attempt)
+    return None
+
+
+def fetch_report_in_session(connect, report_id, report_format_id):
+    """
+    Download a report in the given format over a dedicated GMP session.
+
+    The python-gvm client is not thread-safe on a single connection, so each concurrent
+    download opens its own session.
+
+    Args:
+        connect (callable): Opens a new authenticated GMP session (see gmp_session).
+        report_id (str): ID of the report to download.
+        report_format_id (str): ID of the report format to download.
+
+    Returns:
+        str: The base64-encoded report content, or None if no content was returned.
+    """
+    with connect() as gmp:
+        return fetch_report_content(gmp, report_id, report_format_id)
+
 
 def process_csv_report(csv_path, vuln_mapping_file='vuln_mapping.json', finding_mapping_file='finding_mapping.json'):
     """
@@ -117,12 +457,17 @@ def process_csv_report(csv_path, vuln_mapping_file='vuln_mapping.json', finding_
         logger.warning("No rows were updated in the CSV report.")
 
 
-def update_nvt():
-    """
-    Update the Network Vulnerability Tests (NVT) feed for Greenbone Vulnerability Management (GVM).
+# Sync command for each Greenbone feed, keyed by the feed name
+FEED_SYNC_COMMANDS = {
+    "NVT": ["greenbone-nvt-sync"],
+    "SCAP": ["greenbone-scapdata-sync"],
+    "CERT": ["greenbone-certdata-sync"],
+}
 
-    This function runs 'greenbone-nvt-sync' to ensure that the NVT feed is up-to-date.
-    It handles any exceptions that may occur during the update process.
+
+def print_scan_banner():
+    """
+    Print and log the banner marking the start of the Greenbone vulnerability scan.
     """
     print(colored(">>> Greenbone Vulnerability Scan", attrs=["bold"]))
     print(
@@ -130,109 +475,107 @@ def update_nvt():
         + "Greenbone Vulnerability Scan Started"
     )
     logger.info("Greenbone vulnerability scan started")
-    try:
-        # Command to update the NVT feed
-        nvt_command = ["greenbone-nvt-sync"]
-        nvt_msg = colored("Updating NVT feed", "white")
-        logger.info("Updating NVT feed")
 
-        print(nvt_msg)
 
-        # Run the NVT update command with a timeout of 2700 seconds (45 minutes)
+def update_feed(feed):
+    """
+    Update a single Greenbone Vulnerability Management (GVM) feed.
+
+    This function runs the sync command registered for the feed in FEED_SYNC_COMMANDS.
+    It handles any exceptions that may occur during the update process.
+
+    Args:
+        feed (str): Name of the feed to update ("NVT", "SCAP" or "CERT").
+
+    Returns:
+        bool: True if the feed was updated successfully, False otherwise.
+    """
+    try:
+        print(colored(f"Updating {feed} feed", "white"))
+        logger.info(f"Updating {feed} feed")
+
+        # Resolve the sync tool to an absolute path so subprocess can use posix_spawn
+        # instead of fork/exec when starting it
+        command = list(FEED_SYNC_COMMANDS[feed])
+        command[0] = shutil.which(command[0]) or command[0]
+
+        # Run the update command with a timeout of 2700 seconds (45 minutes)
+        # The sync progress output is never read, so it is discarded instead of buffered
+        # close_fds=False is also required for posix_spawn; Python's own descriptors are
+        # non-inheritable (PEP 446), so no descriptors leak into the child
         subprocess.run(
-            nvt_command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
             check=True,
             timeout=2700,
         )
-        print(colored("NVT update successful", "white"))
-        logger.info("NVT updated successful")
+
+        print(colored(f"{feed} update successful", "white"))
+        logger.info(f"{feed} updated successful")
+        return True
     except subprocess.CalledProcessError as e:
         print(
             colored(f"[ERROR] An error occurred while updating the feeds: {e}", "red")
         )
-        logger.error(f"An error occurred while updating the NVT feed: {e}")
+        logger.error(f"An error occurred while updating the {feed} feed: {e}")
     except Exception as e:
         print(colored(f"[ERROR] Unexpected error: {e}", "red"))
-        logger.error(f"An unexpected error occurred while updating the NVT feed: {e}")
+        logger.error(f"An unexpected error occurred while updating the {feed} feed: {e}")
+    return False
 
 
-def update_scap():
+def update_all_feeds():
     """
-    Update the Security Content Automation Protocol (SCAP) feed for Greenbone Vulnerability Management (GVM).
+    Update the NVT, SCAP and CERT feeds concurrently.
 
-    This function runs 'greenbone-scapdata-sync' to ensure that the SCAP feed is up-to-date.
-    It handles any exceptions that may occur during the update process.
+    The feeds are independent and their sync tools are network-bound, so running them
+    side by side takes roughly as long as the slowest feed rather than the sum of all three.
+
+    Returns:
+        bool: True if every feed was updated successfully, False otherwise.
     """
-    try:
-        # Command to update the SCAP feed
-        scap_command = ["greenbone-scapdata-sync"]
-        scap_msg = colored("Updating SCAP feed", "white")
-        logger.info("Updating SCAP feed")
+    print_scan_banner()
 
-        print(scap_msg)
+    with ThreadPoolExecutor(max_workers=len(FEED_SYNC_COMMANDS)) as executor:
+        futures = [executor.submit(update_feed, feed) for feed in FEED_SYNC_COMMANDS]
+        results = [future.result() for future in as_completed(futures)]
 
-        # Run the SCAP update command with a timeout of 2700 seconds (45 minutes)
-        subprocess.run(
-            scap_command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True,
-            timeout=2700,
-        )
+    if all(results):
+        print(colored("[INFO]", "cyan") + " Feed updates completed\n")
+        logger.info("All feeds updated successfully")
+    return all(results)
 
-        print(colored("SCAP data update successful", "white"))
-        logger.info("SCAP updated successful")
-    except subprocess.CalledProcessError as e:
-        print(
-            colored(f"[ERROR] An error occurred while updating the feeds: {e}", "red")
-        )
-        logger.error(f"An error occurred while updating the SCAP feed: {e}")
-    except Exception as e:
-        print(colored(f"[ERROR] Unexpected error: {e}", "red"))
-        logger.error(f"An unexpected error occurred while updating the SCAP feed: {e}")
 
+def update_nvt():
+    """
+    Update the Network Vulnerability Tests (NVT) feed for Greenbone Vulnerability Management (GVM).
 
-def update_cert():
+    This function runs 'greenbone-nvt-sync' to ensure that the NVT feed is up-to-date.
     """
-    Update the CERT feed for Greenbone Vulnerability Management (GVM).
+    print_scan_banner()
+    update_feed("NVT")
 
-    This function runs 'greenbone-certdata-sync' to ensure that the CERT feed is up-to-date.
-    It handles any exceptions that may occur during the update process.
+
+def update_scap():
     """
-    try:
-        # Command to update the CERT feed
-        cert_command = ["greenbone-certdata-sync"]
-        cert_msg = colored("Updating CERT feed", "white")
-        logger.info("Updating CERT feed")
+    Update the Security Content Automation Protocol (SCAP) feed for Greenbone Vulnerability Management (GVM).
 
-        print(cert_msg)
+    This function runs 'greenbone-scapdata-sync' to ensure that the SCAP feed is up-to-date.
+    """
+    update_feed("SCAP")
 
-        # Run the CERT update command with a timeout of 2700 seconds (45 minutes)
-        subprocess.run(
-            cert_command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True,
-            timeout=2700,
-        )
 
-        print(colored("CERT data update successful", "white"))
-        logger.info("CERT updated successful")
+def update_cert():
+    """
+    Update the CERT feed for Greenbone Vulnerability Management (GVM).
+
+    This function runs 'greenbone-certdata-sync' to ensure that the CERT feed is up-to-date.
+    """
+    if update_feed("CERT"):
         print(colored("[INFO]", "cyan") + " Feed updates completed\n")
         logger.info("All feeds updated successfully")
-    except subprocess.CalledProcessError as e:
-        print(
-            colored(f"[ERROR] An error occurred while updating the feeds: {e}", "red")
-        )
-        logger.error(f"An error occurred while updating the CERT feed: {e}")
-    except Exception as e:
-        print(colored(f"[ERROR] Unexpected error: {e}", "red"))
-        logger.error(f"An unexpected error occurred while updating the CERT feed: {e}")
 
 
 def read_host_from_file(file_path):
@@ -246,9 +589,8 @@ def read_host_from_file(file_path):
         str: A comma-separated string of host IPs.
     """
     with open(file_path, "r") as file:
-        # Read each line, strip whitespace, and ignore empty lines
-        hosts = [line.strip() for line in file if line.strip()]
-        # Join the hosts into a comma-separated string
+        # Strip each line once, ignore empty lines and join the hosts into a comma-separated string
+        hosts = ",".join(host for host in (line.strip() for line in file) if host)
 
     if not hosts:
         print(
@@ -256,19 +598,419 @@ def read_host_from_file(file_path):
         )
         logger.error(f"No hosts found in file: {file_path}")
 
-    return ",".join(hosts)
+    return hosts
+
+
+def get_connection_timeout(target_ip):
+    """
+    Calculate the GMP connection timeout for a scan from the number of target hosts.
+
+    A high timeout is used to prevent a timeout error during long operations,
+    e.g. 3 hosts -> 3 hours, with a minimum of 1 hour.
+
+    Args:
+        target_ip (str): Path to the file containing target IPs or a single IP.
+
+    Returns:
+        int: The connection timeout in seconds.
+    """
+    hosts = read_host_from_file(target_ip)
+    number_of_hosts = len(hosts.split(",")) if hosts else 0
+    timeout_hours = max(number_of_hosts, 1)  # Default to 1 hour if no hosts are specified
+    return timeout_hours * 3600  # Convert hours to seconds
+
+
+@contextmanager
+def gmp_session(path, username, password, timeout=3600):
+    """
+    Open an authenticated GMP session over the GVM Unix socket.
+
+    The session can be reused for several scans, which avoids reconnecting and
+    re-authenticating for every scan.
+
+    Args:
+        path (str): Path to the Unix socket for GVM connection.
+        username (str): Username for the GVM server.
+        password (str): Password for the GVM server.
+        timeout (int): Connection timeout in seconds.
+
+    Yields:
+        Gmp: The authenticated GMP session.
+    """
+    connection = UnixSocketConnection(path=path, timeout=timeout)
+    with Gmp(connection=connection) as gmp:
+        # Authenticate with the GVM using provided credentials
+        gmp.authenticate(username, password)
+        logger.info("Authenticated with Greenbone")
+        yield gmp
+
+
+def create_and_start_task(
+    gmp, target_name, hosts, port_list_name, task_name, scan_config, scanner
+):
+    """
+    Create the target (unless it already exists) and the scan task, then start the task.
+
+    Args:
+        gmp (Gmp): An authenticated GMP session.
+        target_name (str): Name of the target to be scanned.
+        hosts (str): Comma-separated list of target hosts.
+        port_list_name (str): Port list ID for target configuration.
+        task_name (str): Name of the task to be created and executed.
+        scan_config (str): Scan configuration ID.
+        scanner (str): Scanner ID.
+
+    Returns:
+        tuple: The ID of the started task and the ID of its report.
+    """
+    # Check if the target already exists, filtering by name on the server
+    # so only the matching target is returned instead of every target
+    targets_list = gmp.get_targets(filter_string=f'name="{target_name}" rows=1')
+    targets_list_xml = etree.fromstring(targets_list)
+    targetid = None
+
+    target = targets_list_xml.find("target")
+    if target is not None and target.findtext("name") == target_name:
+        targetid = target.get("id")
+        print(
+            colored("[INFO]", "cyan")
+            + f" Target {target_name} already exists with ID: {targetid}"
+        )
+        logger.info(f"Created target with ID: {targetid}")
+        print(colored("[INFO]", "cyan") + " Creating task with this target")
+
+    if not targetid:
+        # Create a new target if it doesn't exist
+        print(
+            colored("[INFO]", "cyan")
+            + f" Target {target_name} does not already exist. Creating a new target"
+        )
+        target_response = gmp.create_target(
+            name=target_name, hosts=[hosts], port_list_id=port_list_name
+        )
+        targetid = extract_response_id(target_response)
+        print(colored("[INFO]", "cyan") + f" Target ID is: {targetid}")
+        logger.info(f"Created target with ID: {targetid}")
+
+    if targetid:
+        # Create a task for the target
+        create_task = gmp.create_task(
+            name=task_name,
+            config_id=scan_config,
+            target_id=targetid,
+            scanner_id=scanner,
+        )
+        taskid = extract_response_id(create_task)
+        print(colored("[INFO]", "cyan") + f" Task created with ID: {taskid}")
+        logger.info(f"Task created with ID: {taskid}")
+    else:
+        print(colored("[ERROR] Failed to create task", "red"))
+        logger.error("Failed to create task")
+        exit(1)
+
+    print(colored("[INFO]", "cyan") + " Waiting for task to be ready")
+    if not wait_for_task_ready(gmp, taskid):
+        print(
+            colored("[WARNING]", "yellow")
+            + " Task is not yet reported as ready, starting it anyway"
+        )
+        logger.warning(f"Task {taskid} not reported as ready before start")
+
+    start_task = gmp.start_task(task_id=taskid)
+    print(
+        colored("[INFO]", "cyan")
+        + f" Task started successfully with ID: {taskid}\n"
+    )
+    logger.info(f"Task started with ID: {taskid}")
+
+    # Extract the report ID from the response
+    reportid = extract_report_id(start_task)
+
+    gvm_text = colored("Scanning...", "white")
+    logger.info("Scan started")
+
+    print(gvm_text)
+
+    return taskid, reportid
+
+
+def poll_delays():
+    """
+    Generate the delays between task status polls.
+
+    The poll interval backs off exponentially so short scans are picked up quickly
+    while long scans are not polled needlessly often.
+
+    Yields:
+        float: The next delay in seconds.
+    """
+    delay = POLL_DELAY_START
+    while True:
+        yield delay
+        delay = min(delay * 1.5, POLL_DELAY_MAX)
+
+
+def print_task_progress(task_status, elapsed, previous_status=None):
+    """
+    Print the current status of a running scan.
+
+    On a terminal the status line is rewritten in place. When the output is piped
+    (e.g. to the GUI), a line is only printed when the status changes.
+
+    Args:
+        task_status (str): The current task status.
+        elapsed (float): Seconds since the scan was started.
+        previous_status (str, optional): The status printed by the previous poll.
+    """
+    if sys.stdout.isatty():
+        elapsed_time = time.strftime("%H:%M:%S", time.gmtime(elapsed))
+        print(f"\rScanning... {task_status} ({elapsed_time})", end="", flush=True)
+    elif task_status != previous_status:
+        print(colored(f"Scanning... {task_status}", "white"), flush=True)
+
+
+def report_scan_status(task_status):
+    """
+    Print and log the final status of a scan.
+
+    Args:
+        task_status (str): The final task status.
+    """
+    if sys.stdout.isatty():
+        print()  # End the in-place status line
+    print(colored(f"Scan completed, status: {task_status}", "white"))
+    logger.info(f"Scan completed, status: {task_status}")
+
+
+def wait_for_task_done(gmp, task_id, reauthenticate=None):
+    """
+    Monitor the status of a task until it has finished.
+
+    A dropped connection is retried rather than abandoning the running scan.
+
+    Args:
+        gmp (Gmp): An authenticated GMP session.
+        task_id (str): ID of the task.
+        reauthenticate (callable, optional): Re-authenticates the GMP session after a failure.
+
+    Returns:
+        str: The final task status ("Done", "Stopped" or "Failed").
+    """
+    task_status = ""
+    delays = poll_delays()
+    started = time.monotonic()
+    while task_status not in FINISHED_TASK_STATES:
+        time.sleep(next(delays))
+        previous_status = task_status
+        task_status = (
+            call_with_retry(get_task_status, gmp, task_id, reauthenticate=reauthenticate)
+            or task_status
+        )
+        print_task_progress(task_status, time.monotonic() - started, previous_status)
+
+    report_scan_status(task_status)
+    return task_status
+
+
+def wait_for_report_content(future, gmp, report_id, report_format_id, reauthenticate=None):
+    """
+    Get the content of a report download, falling back to the shared session if needed.
+
+    If the download was not started on its own session, or that session failed,
+    the report is fetched on the given session instead.
+
+    Args:
+        future (Future): The concurrent download of the report, or None.
+        gmp (Gmp): An authenticated GMP session.
+        report_id (str): ID of the report to download.
+        report_format_id (str): ID of the report format to download.
+        reauthenticate (callable, optional): Re-authenticates the GMP session after a failure.
+
+    Returns:
+        str: The base64-encoded report content, or None if no content was returned.
+    """
+    if future is not None:
+        try:
+            return future.result()
+        except (GvmError, OSError) as e:
+            logger.warning(f"Concurrent report download failed, retrying on the main session: {e}")
+    return fetch_report_content(
+        gmp, report_id, report_format_id, reauthenticate=reauthenticate
+    )
+
+
+def download_reports(gmp, reportid, task_name, connect=None, reauthenticate=None):
+    """
+    Print the report summary and download the PDF and CSV reports of a finished scan.
+
+    Args:
+        gmp (Gmp): An authenticated GMP session.
+        reportid (str): ID of the report of the finished task.
+        task_name (str): Name of the task, used in the report filenames.
+        connect (callable, optional): Opens a new authenticated GMP session (see gmp_session).
+            When given, the PDF and CSV reports are downloaded concurrently on their own sessions.
+        reauthenticate (callable, optional): Re-authenticates the GMP session after a failure.
+
+    Returns:
+        tuple: The same tuple as openvas_scan, or None if the CSV report could not be downloaded.
+    """
+    # Capture the completion time once for the console output and the report filenames
+    completed_at = time.localtime()
+    completion_time = time.strftime("%H:%M:%S %Y/%m/%d", completed_at)
+    timestamp = time.strftime("%Y:%m:%d_%H:%M:%S", completed_at)
+    print(
+        colored(f"[{completion_time}] [INFO]", "cyan")
+        + " Greenbone vulnerability scan completed\n"
+    )
+    print(
+        colored(
+            ">>> Report Summary",
+            attrs=["bold"],
+        )
+    )
+
+    # Download the PDF and CSV reports on their own sessions while the summary is processed
+    pdf_future = csv_future = None
+    if connect is not None:
+        download_executor = ThreadPoolExecutor(max_workers=2)
+        pdf_future, csv_future = (
+            download_executor.submit(
+                fetch_report_in_session, connect, reportid, report_format_id
+            )
+            for report_format_id in (PDF_REPORT_FORMAT_ID, CSV_REPORT_FORMAT_ID)
+        )
+        download_executor.shutdown(wait=False)
+
+    # Report summary logic
+    try:
+        # Get the XML report summary only, the per-result details are not needed for the counts
+        xml_report_response = call_with_retry(
+            gmp.get_report,
+            reauthenticate=reauthenticate,
+            report_id=reportid,
+            report_format_id=XML_REPORT_FORMAT_ID,
+            filter_string=SUMMARY_FILTER,
+            details=False,
+        )
+
+        summary = summarise_report(xml_report_response)
+        hosts_count = summary.get("hosts", 0)
+        os_count = summary.get("os", 0)
+        apps_count = summary.get("apps", 0)
+        high_count = summary["High"]
+        medium_count = summary["Medium"]
+        low_count = summary["Low"]
+
+        # Display the report summary
+        print(
+            colored("- Hosts Scanned", "cyan")
+            + colored(f"              : {hosts_count}", "white")
+        )
+        print(
+            colored("- Applications Scanned", "cyan")
+            + colored(f"       : {apps_count}", "white")
+        )
+        print(
+            colored("- Operating Systems Scanned", "cyan")
+            + colored(f"  : {os_count}", "white")
+        )
+
+        print(
+            colored("- High Vulnerabilities", "cyan")
+            + colored(f"       : {high_count}", "red", attrs=["bold"])
+        )
+        print(
+            colored("- Medium vulnerabilities", "cyan")
+            + colored(f"     : {medium_count}", "yellow", attrs=["bold"])
+        )
+        print(
+            colored("- Low vulnerabilities", "cyan")
+            + colored(f"        : {low_count}\n", "green", attrs=["bold"])
+        )
+    except Exception as e:
+        print(colored(f"[ERROR] Unable to print report summary: {e}"))
+
+    print(
+        colored(f"[{completion_time}] [INFO]", "cyan")
+        + " Downloading report"
+    )
+    # Make sure the reports directory exists before anything is written to it
+    OPENVAS_REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    try:
+        # Wait for the base64-encoded PDF content
+        content = wait_for_report_content(
+            pdf_future, gmp, reportid, PDF_REPORT_FORMAT_ID, reauthenticate
+        )
+        if not content:
+            raise ValueError("GVM returned an empty PDF report")
+
+        # Decode the base64 content into the PDF file
+        pdf_path = OPENVAS_REPORTS_DIR / f"openvas_{task_name}_report_{timestamp}.pdf"
+        write_base64_file(content, pdf_path)
+        print(
+            colored("[INFO]", "cyan")
+            + f" PDF Report downloaded as"
+            + colored(f" {pdf_path}", attrs=["bold"])
+        )
+        logger.info(f"PDF report downloaded as {pdf_path}")
+    except Exception as e:
+        print(colored(f"[ERROR] Failed to download PDF report: {e}", "red"))
+        logger.error(f"Failed to download PDF report: {e}")
+
+    # Writes the csv file
+    try:
+        # Wait for the base64-encoded CSV content
+        csv_content = wait_for_report_content(
+            csv_future, gmp, reportid, CSV_REPORT_FORMAT_ID, reauthenticate
+        )
+        if csv_content:
+            csv_path = OPENVAS_REPORTS_DIR / f"{task_name}_report_{timestamp}.csv"
+            write_base64_file(csv_content, csv_path)
+
+            print(
+                colored("[INFO]", "cyan")
+                + f" CSV Report downloaded as"
+                + colored(f" {csv_path}", attrs=["bold"])
+            )
+            logger.info(f"CSV report downloaded as {csv_path}")
+
+            # Process the CSV to add MID
+            process_csv_report(str(csv_path))
+
+            # Return the necessary information for report generation
+            return (
+                str(csv_path),
+                str(task_name),
+                hosts_count,
+                high_count,
+                medium_count,
+                low_count,
+                apps_count,
+                os_count,
+            )
+
+        print(
+            colored(f"[{print_timestamp}] [+]", "cyan")
+            + " Greenbone scan completed.\n"
+        )
+        logger.info("Greenbone scan completed\n")
+
+    except Exception as e:
+        print(colored(f"[ERROR] Failed to download CSV report: {e}", "red"))
+        logger.error(f"Failed to download CSV report: {e}")
 
 
 def openvas_scan(
-    path,
-    username,
-    password,
+    gmp,
     target_name,
     target_ip,
     port_list_name,
     task_name,
     scan_config,
     scanner,
+    connect=None,
+    reauthenticate=None,
 ):
     """
     Perform an OpenVAS scan using Greenbone Vulnerability Management (GVM).
@@ -278,15 +1020,17 @@ def openvas_scan(
     The scan results are saved in both PDF and CSV formats.
 
     Args:
-        path (str): Path to the Unix socket for GVM connection.
-        username (str): Username for the GVM server.
-        password (str): Password for the GVM server.
+        gmp (Gmp): An authenticated GMP session, which can be reused across scans.
         target_name (str): Name of the target to be scanned.
         target_ip (str): Path to the file containing target IPs or a single IP.
         port_list_name (str): Port list ID for target configuration.
         task_name (str): Name of the task to be created and executed.
         scan_config (str): Scan configuration ID.
         scanner (str): Scanner ID.
+        connect (callable, optional): Opens a new authenticated GMP session (see gmp_session).
+            When given, the PDF and CSV reports are downloaded concurrently on their own sessions.
+        reauthenticate (callable, optional): Re-authenticates the GMP session after a dropped
+            connection, so status polls and report downloads are retried instead of losing the scan.
 
     Returns:
         tuple: A tuple containing:
@@ -305,295 +1049,17 @@ def openvas_scan(
     """
     # Read the target IPs from the specified file
     hosts = read_host_from_file(target_ip)
-    number_of_hosts = len(hosts.split(",")) if hosts else 0
-
-    # Calculate the timeout based on the number of hosts (e.g., 3 hosts -> 3 hours)
-    # Ensure at least a minimum timeout (e.g., 1 hour) to handle small numbers
-    if number_of_hosts > 0:
-        timeout_hours = number_of_hosts
-    else:
-        timeout_hours = 1  # Default to 1 hour if no hosts are specified
-
-    connection_timeout = timeout_hours * 3600  # Convert hours to seconds
 
     try:
-        # Establish a Unix socket connection to the GVM server
-        # A high timeout value is set to prevent a timeout error during long operations
-        connection = UnixSocketConnection(path=path, timeout=connection_timeout)
-        with Gmp(connection=connection) as gmp:
-            # Authenticate with the GVM using provided credentials
-            gmp.authenticate(username, password)
-            logger.info("Authenticated with Greenbone")
-
-            # Retrieve existing targets and check if the target already exists
-            targets_list = gmp.get_targets()
-            targets_list_xml = ET.fromstring(targets_list)
-            targetid = None
-
-            for target in targets_list_xml.findall(".//target"):
-                if target.find("name").text == target_name:
-                    targetid = target.get("id")
-                    print(
-                        colored("[INFO]", "cyan")
-                        + f" Target {target_name} already exists with ID: {targetid}"
-                    )
-                    logger.info(f"Created target with ID: {targetid}")
-                    print(colored("[INFO]", "cyan") + " Creating task with this target")
-
-            if not targetid:
-                # Create a new target if it doesn't exist
-                print(
-                    colored("[INFO]", "cyan")
-                    + f" Target {target_name} does not already exist. Creating a new target"
-                )
-                target_response = gmp.create_target(
-                    name=target_name, hosts=[hosts], port_list_id=port_list_name
-                )
-                target_xml = ET.fromstring(target_response)
-                targetid = target_xml.get("id")
-                print(colored("[INFO]", "cyan") + f" Target ID is: {targetid}")
-                logger.info(f"Created target with ID: {targetid}")
-
-            if targetid:
-                # Create a task for the target
-                create_task = gmp.create_task(
-                    name=task_name,
-                    config_id=scan_config,
-                    target_id=targetid,
-                    scanner_id=scanner,
-                )
-                task_xml = ET.fromstring(create_task)
-                taskid = task_xml.get("id")
-                print(colored("[INFO]", "cyan") + f" Task created with ID: {taskid}")
-                logger.info(f"Task created with ID: {taskid}")
-            else:
-                print(colored("[ERROR] Failed to create task", "red"))
-                logger.error("Failed to create task")
-                exit(1)
-
-            print(colored("[INFO]", "cyan") + " Waiting for task to be ready")
-            time.sleep(5)  # Wait for the task to be ready
+        taskid, reportid = create_and_start_task(
+            gmp, target_name, hosts, port_list_name, task_name, scan_config, scanner
+        )
 
-            start_task = gmp.start_task(task_id=taskid)
-            print(
-                colored("[INFO]", "cyan")
-                + f" Task started successfully with ID: {taskid}\n"
-            )
-            logger.info(f"Task started with ID: {taskid}")
-
-            # Extract the report ID from the response
-            report_xml = ET.fromstring(start_task)
-            reportid = report_xml.find("report_id").text
-
-            gvm_text = colored("Scanning...", "white")
-            logger.info("Scan started")
-
-            print(gvm_text)
-
-            # Monitor the status of the task until it's completed
-            task_status = ""
-            while task_status not in ["Done", "Stopped", "Failed"]:
-                # Checks the status of the scan every 30 seconds, increase this value if timeout errors persist
-                time.sleep(30)
-                task_response = gmp.get_task(task_id=taskid)
-                task_status_xml = ET.fromstring(task_response)
-                task_status = task_status_xml.find(".//status").text
-
-            print(colored(f"Scan completed, status: {task_status}", "white"))
-            logger.info(f"Scan completed, status: {task_status}")
-
-            if task_status == "Done":
-                completion_time = time.strftime("%H:%M:%S %Y/%m/%d")
-                print(
-                    colored(f"[{completion_time}] [INFO]", "cyan")
-                    + " Greenbone vulnerability scan completed\n"
-                )
-                print(
-                    colored(
-                        ">>> Report Summary",
-                        attrs=["bold"],
-                    )
-                )
-
-                # Report summary logic
-                try:
-                    # Get XML report
-                    xml_report_response = gmp.get_report(
-                        report_id=reportid,
-                        report_format_id="a994b278-1f62-11e1-96ac-406186ea4fc5",  # XML report format ID
-                        ignore_pagination=True,
-                        details=True,
-                    )
-
-                    def get_count_value(element, path):
-                        """
-                        Helper function to extract count values from XML.
-
-                        Args:
-                            element (Element): XML element to search within.
-                            path (str): XPath to the desired count element.
-
-                        Returns:
-                            int: The count value extracted from the XML.
-                        """
-                        count_element = element.find(path)
-                        return int(count_element.text)
-
-                    rep_xml = ET.fromstring(xml_report_response)
-                    hosts_count = get_count_value(rep_xml, ".//hosts/count")
-                    os_count = get_count_value(rep_xml, ".//os/count")
-                    apps_count = get_count_value(rep_xml, ".//apps/count")
-                    high_count = 0
-                    medium_count = 0
-                    low_count = 0
-
-                    # Count vulnerabilities by severity
-                    for threat in rep_xml.findall(".//original_threat"):
-                        level = threat.text
-                        if level == "High":
-                            high_count += 1
-                        elif level == "Medium":
-                            medium_count += 1
-                        elif level == "Low":
-                            low_count += 1
-
-                    # Display the report summary
-                    print(
-                        colored("- Hosts Scanned", "cyan")
-                        + colored(f"              : {hosts_count}", "white")
-                    )
-                    print(
-                        colored("- Applications Scanned", "cyan")
-                        + colored(f"       : {apps_count}", "white")
-                    )
-                    print(
-                        colored("- Operating Systems Scanned", "cyan")
-                        + colored(f"  : {os_count}", "white")
-                    )
-
-                    print(
-                        colored("- High Vulnerabilities", "cyan")
-                        + colored(f"       : {high_count}", "red", attrs=["bold"])
-                    )
-                    print(
-                        colored("- Medium vulnerabilities", "cyan")
-                        + colored(f"     : {medium_count}", "yellow", attrs=["bold"])
-                    )
-                    print(
-                        colored("- Low vulnerabilities", "cyan")
-                        + colored(f"        : {low_count}\n", "green", attrs=["bold"])
-                    )
-                except Exception as e:
-                    print(colored(f"[ERROR] Unable to print report summary: {e}"))
-
-                print(
-                    colored(f"[{completion_time}] [INFO]", "cyan")
-                    + " Downloading report"
-                )
+        # Monitor the status of the task until it's completed
+        task_status = wait_for_task_done(gmp, taskid, reauthenticate)
 
-                try:
-                    # Get PDF report
-                    pdf_report_response = gmp.get_report(
-                        report_id=reportid,
-                        report_format_id="c402cc3e-b531-11e1-9163-406186ea4fc5",  # PDF report format ID
-                        ignore_pagination=True,
-                        details=True,
-                    )
-
-                    # Creates a timestamp
-                    timestamp = time.strftime("%Y:%m:%d_%H:%M:%S")
-                    # Creates the filename for the report
-                    pdf_filename = os.path.join(
-                        "openvas_reports", f"openvas_{task_name}_report_{timestamp}.pdf"
-                    )
-
-                    # Extracts the report content from the response
-                    root = ET.fromstring(pdf_report_response)
-                    report_element = root.find("report")
-                    content = report_element.find(
-                        "report_format"
-                    ).tail.strip()  # Extract the base64-encoded PDF Content
-                    binary_pdf = b64decode(
-                        content.encode("ascii")
-                    )  # Decode the base64 content into binary PDF data
-
-                    # Save the PDF to a file with the constructed filename
-                    pdf_path = Path(
-                        pdf_filename
-                    ).expanduser()  # Create the full path for the PDF file
-                    pdf_path.write_bytes(
-                        binary_pdf
-                    )  # Write the binary data to the file
-                    time.sleep(5)
-                    print(
-                        colored("[INFO]", "cyan")
-                        + f" PDF Report downloaded as"
-                        + colored(f" {pdf_path}", attrs=["bold"])
-                    )
-                    logger.info(f"PDF report downloaded as {pdf_path}")
-                except Exception as e:
-                    print(colored(f"[ERROR] Failed to download PDF report: {e}", "red"))
-                    logger.error(f"Failed to download PDF report: {e}")
-
-                # Writes the csv file
-                try:
-                    time.sleep(10)  # Wait to ensure the report is ready
-
-                    csv_report_format_id = "c1645568-627a-11e3-a660-406186ea4fc5"
-
-                    # Retrieve CSV report
-                    csv_report_response = gmp.get_report(
-                        report_id=reportid,
-                        report_format_id=csv_report_format_id,
-                        ignore_pagination=True,
-                        details=True,
-                    )
-
-                    csv_root = ET.fromstring(csv_report_response)
-                    csv_element = csv_root.find("report")
-
-                    if csv_element is not None:
-                        csv_content = csv_element.find("report_format").tail
-                        if csv_content:
-                            binary_base64_encoded_csv = csv_content.encode("ascii")
-                            binary_csv = b64decode(binary_base64_encoded_csv)
-                            csv_filename = os.path.join(
-                                "openvas_reports", f"{task_name}_report_{timestamp}.csv"
-                            )
-                            csv_path = Path(csv_filename).expanduser()
-                            csv_path.write_bytes(binary_csv)
-
-                            print(
-                                colored("[INFO]", "cyan")
-                                + f" CSV Report downloaded as"
-                                + colored(f" {csv_path}", attrs=["bold"])
-                            )
-                            logger.info(f"CSV report downloaded as {csv_path}")
-
-                            # Process the CSV to add MID
-                            process_csv_report(str(csv_path))
-
-                            # Return the necessary information for report generation
-                            return (
-                                str(csv_path),
-                                str(task_name),
-                                hosts_count,
-                                high_count,
-                                medium_count,
-                                low_count,
-                                apps_count,
-                                os_count,
-                            )
-
-                        print(
-                            colored(f"[{print_timestamp}] [+]", "cyan")
-                            + " Greenbone scan completed.\n"
-                        )
-                        logger.info("Greenbone scan completed\n")
-
-                except Exception as e:
-                    print(colored(f"[ERROR] Failed to download CSV report: {e}", "red"))
-                    logger.error(f"Failed to download CSV report: {e}")
+        if task_status == "Done":
+            return download_reports(gmp, reportid, task_name, connect, reauthenticate)
     except GvmError as e:
         # Handle GVM-specific errors
         print(colored(f"[ERROR] An error occurred: {e}", "red"))
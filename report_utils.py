@@ -1,21 +1,33 @@
 import os
-import io
 import time
 import re
 import json
+import shutil
+import hashlib
+import io
+import mmap
 import numpy as np
 import pandas as pd
+import matplotlib
+
+# Render charts with the non-interactive Agg backend; they are only ever saved to PNG files
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
 from matplotlib.colors import to_rgba
-from matplotlib.patches import Patch
+from matplotlib.patches import Patch, Wedge
+from matplotlib.figure import Figure
+from PIL import Image as PILImage
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, mm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
     SimpleDocTemplate,
     Table,
+    LongTable,
     TableStyle,
     Paragraph,
     Spacer,
@@ -27,14 +39,155 @@ from reportlab.graphics import renderPDF
 from pandas.api.types import CategoricalDtype
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from termcolor import colored
 from logger import logger
 
+try:
+    # pyarrow is optional; its multithreaded CSV reader is used for the OpenVAS results when available
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+try:
+    # orjson is optional; it reads and writes the historical scan counts faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Columns of the OpenVAS CSV report used in the executive report
+OPENVAS_REPORT_COLUMNS = [
+    "IP",
+    "CVSS",
+    "Severity",
+    "QoD",
+    "NVT Name",
+    "Summary",
+    "Impact",
+    "Solution",
+    "DID",
+]
+
+# Columns parsed to numbers while the OpenVAS CSV report is read; empty scores become NaN
+OPENVAS_REPORT_DTYPES = {"CVSS": "float64"}
+
+# Severities listed in the report, in order; 'Log' and unknown severities become missing values
+SEVERITY_DTYPE = CategoricalDtype(categories=["High", "Medium", "Low"], ordered=True)
+
+# Resolution of the charts embedded in the PDF report; they are drawn at 2-7 inches wide,
+# so 150 dpi is plenty for screen and print while needing a quarter of the pixels of 300 dpi
+REPORT_CHART_DPI = 150
+
+# ReportLab decodes the chart PNGs and re-compresses their pixels into the PDF itself,
+# so the intermediate files are written with the fastest zlib level
+REPORT_CHART_PNG_OPTIONS = {"compress_level": 1}
+
+# Colors kept in the palette of the report donut charts
+REPORT_CHART_PALETTE_COLORS = 64
+
+# Rendered GUI pie charts, keyed by their inputs, so unchanged charts are copied instead of redrawn
+GUI_CHART_CACHE_DIR = os.path.join("result_graphs", ".cache")
+
+# Historical scan records last loaded or saved, keyed by file path along with the file's mtime,
+# so scheduled scans in the same process do not re-read a file they wrote themselves
+HISTORICAL_DATA_CACHE = {}
+
+# Format of the timestamps stored with each historical scan record
+HISTORICAL_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Most points drawn per line in the historical graph
+HISTORICAL_GRAPH_MAX_POINTS = 200
+
+# Characters of scan text that Paragraph would otherwise read as markup
+PARAGRAPH_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Body rows per table when a long appendix table is split into several tables
+TABLE_CHUNK_ROWS = 50
+
+# Dark blue background of the table header rows and the severity labels
+HEADER_BACKGROUND_COLOR = colors.HexColor("#2C3E50")
+
+# Border and text color of the Asset Criticality Score (1-5) boxes in the host metrics table
+ACS_COLORS = {
+    1: colors.HexColor("#264653"),
+    2: colors.HexColor("#2A9D8F"),
+    3: colors.HexColor("#E9C46A"),
+    4: colors.HexColor("#F4A261"),
+    5: colors.HexColor("#E76f51"),
+}
+
+# Background colors alternated over the body rows of the report tables, starting with the first row
+ROW_STRIPE_COLORS = [colors.HexColor("#F2F3F4"), colors.HexColor("#EAECEE")]  # Lighter gray, light gray
+
+# Start of the timestamped line that opens the section of each exploited CVE in the Metasploit TXT report
+EXPLOIT_SECTION_START_RE = re.compile(rb"^(?=\[[^\]]*\] Exploitable CVE Found)", re.MULTILINE)
+
+# Fields of one exploited CVE, matched within its own section of the report
+EXPLOIT_BLOCK_RE = re.compile(
+    rb"Exploitable CVE Found: (?P<cve>CVE-\d{4}-\d+)"
+    rb".*?Identified Exploit: (?P<exploit>[^\r\n]+)"
+    rb".*?^Target IP:(?P<target_ip>[^\r\n]*)"
+    rb".*?^Target Port:(?P<target_port>[^\r\n]*)"
+    rb".*?^Payload Statistics:"
+    rb".*?^Total: *(?P<payload_total>\d+)"
+    rb".*?^Successful: *(?P<payload_successful>\d+)"
+    rb".*?^Failed: *(?P<payload_failed>\d+)",
+    re.DOTALL | re.MULTILINE,
+)
+
+# Section listing the CVEs Metasploit has no exploit for, up to the report summary
+NO_EXPLOIT_SECTION_RE = re.compile(
+    rb"The following CVEs were detected, but Metasploit does not have an exploit to target these\."
+    rb"(?P<section>.*?)^End of Report Summary",
+    re.DOTALL | re.MULTILINE,
+)
+NO_EXPLOIT_CVE_RE = re.compile(rb"^[ \t]*(CVE-[^\r\n]*?)[ \t]*\r?$", re.MULTILINE)
+
+# Summary counts written one per line at the end of the report
+METASPLOIT_SUMMARY_RE = re.compile(
+    rb"^Total CVEs examined: *(\d+)\s*^Total exploited CVEs: *(\d+)\s*^Incompatible CVEs: *(\d+)",
+    re.MULTILINE,
+)
+
+# Banner and header lines repeated in the combined Nikto CSV results for every target
+NIKTO_SKIP_PREFIXES = ('"Nikto', "Host IP")
+
+# Columns of the combined Nikto CSV results
+NIKTO_COLUMNS = [
+    "Host",
+    "IP",
+    "Port",
+    "Reference",
+    "Method",
+    "URI",
+    "Description",
+    "MID",
+    "DID",
+]
+
 
 # -------------------- #
 #  Header & Footer     #
 # -------------------- #
 
+@lru_cache(maxsize=4)
+def load_header_image(header_image_path, mtime_ns):
+    """
+    Read the report header image, decoding each version of the file only once per process.
+
+    Args:
+        header_image_path (str): Path to the header image.
+        mtime_ns (int): Modification time of the file, so a replaced image is read again.
+
+    Returns:
+        ImageReader: The header image, ready to be drawn on a canvas.
+    """
+    return ImageReader(header_image_path)
+
+
 def add_first_page_header(canvas, doc):
     """
     Add a header image and page number to the first page.
@@ -49,10 +202,12 @@ def add_first_page_header(canvas, doc):
     # Add the header image
     header_image_path = "assets/pdf_header.png"  # Path to your header image
 
-    if os.path.exists(header_image_path):
-        canvas.drawImage(header_image_path, 30, doc.pagesize[1] - 80, width=550, height=50)
-    else:
+    try:
+        header_image = load_header_image(header_image_path, os.stat(header_image_path).st_mtime_ns)
+    except FileNotFoundError:
         print(colored(f"[WARNING] Header image not found at path: {header_image_path}", "red"))
+    else:
+        canvas.drawImage(header_image, 30, doc.pagesize[1] - 80, width=550, height=50)
 
     # Add the page number at the footer
     page_num = canvas.getPageNumber()
@@ -97,6 +252,148 @@ def add_later_page_number(canvas, doc):
 #   Helper Functions   #
 # -------------------- #
 
+def read_openvas_csv(csv_path, columns=None, dtypes=None):
+    """
+    Read an OpenVAS CSV report into a DataFrame.
+
+    The pyarrow CSV reader is used when pyarrow is installed, as it parses large reports
+    on multiple threads. Otherwise pandas' own parser is used.
+
+    Args:
+        csv_path (str): Path to the OpenVAS CSV report.
+        columns (list, optional): Only read these columns.
+        dtypes (dict, optional): Column name to dtype name (e.g. "float64"), parsed while reading.
+
+    Returns:
+        DataFrame: The scan results.
+    """
+    if pacsv is None:
+        return pd.read_csv(csv_path, usecols=columns, dtype=dtypes)
+
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        # OpenVAS results contain quoted multi-line text (summary, insight, solution)
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        # Empty text cells become missing values, as they do with pandas, rather than ""
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns, column_types=dtypes, strings_can_be_null=True
+        ),
+    )
+    return table.to_pandas()
+
+
+def read_nikto_csv(nikto_csv_path):
+    """
+    Read the combined Nikto CSV results into a DataFrame.
+
+    The combined file repeats a "Nikto" banner line and a "Host IP" header line for every
+    scanned target. Their line numbers are collected in a single pass and skipped by the
+    CSV parser, so the file is not copied into memory before parsing.
+
+    Args:
+        nikto_csv_path (str): Path to the combined Nikto CSV results.
+
+    Returns:
+        DataFrame: The Nikto findings, or None if the file contains no findings.
+    """
+    skip_rows = set()
+    line_count = 0
+    with open(nikto_csv_path, "r") as file:
+        for line_count, line in enumerate(file, start=1):
+            # Skip lines that start with "Nikto" or "Host IP", or are empty
+            if line.startswith(NIKTO_SKIP_PREFIXES) or not line.strip():
+                skip_rows.add(line_count - 1)
+
+    # Check if there are any data lines
+    if line_count == len(skip_rows):
+        return None
+
+    nikto_df = pd.read_csv(
+        nikto_csv_path, header=None, names=NIKTO_COLUMNS, skiprows=skip_rows
+    )
+    nikto_df.fillna("N/A", inplace=True)
+    return nikto_df
+
+
+def toc_leader_text(title, width, font_name, font_size):
+    """
+    Pad a Table of Contents title with a dotted leader that fills the given width.
+
+    Args:
+        title (str): Section title.
+        width (float): Width available for the title and its leader, in points.
+        font_name (str): Name of the font the entry is drawn in.
+        font_size (float): Size of the font the entry is drawn in.
+
+    Returns:
+        str: The title followed by as many dots as fit in the width.
+    """
+    text = f"{title} "
+    free_width = width - stringWidth(text, font_name, font_size)
+    dot_count = max(int(free_width // stringWidth(".", font_name, font_size)), 0)
+    return text + "." * dot_count
+
+
+def add_row_stripes(table_style):
+    """
+    Alternate the background color of the body rows of a table.
+
+    A single ROWBACKGROUNDS command covers every body row, however long the table is,
+    so the style does not grow with the number of rows.
+
+    Args:
+        table_style (TableStyle): Style of the table, the header row is left unchanged.
+    """
+    table_style.add("ROWBACKGROUNDS", (0, 1), (-1, -1), ROW_STRIPE_COLORS)
+
+
+def escape_paragraph_columns(frame, columns):
+    """
+    Escape the characters that Paragraph would read as markup in columns of scan results.
+
+    Scan text such as "<script>" in a Nikto description is otherwise parsed as a tag and
+    dropped from the report.
+
+    Args:
+        frame (DataFrame): The scan results.
+        columns (list): Columns whose values are shown in Paragraphs.
+
+    Returns:
+        DataFrame: A copy of the frame with those columns as escaped strings.
+    """
+    return frame.assign(
+        **{column: frame[column].astype(str).str.translate(PARAGRAPH_ESCAPES) for column in columns}
+    )
+
+
+def build_chunked_tables(table_data, col_widths, table_style, chunk_rows=None):
+    """
+    Split a long table into consecutive LongTables of at most chunk_rows body rows each.
+
+    ReportLab measures every remaining row again each time a table is split across a page,
+    which makes a single table with thousands of rows quadratic to lay out. Each chunk repeats
+    the header row, so it also repeats at the top of every page a chunk continues on.
+
+    Args:
+        table_data (list): Table rows, starting with the header row.
+        col_widths (list): Width of each column.
+        table_style (TableStyle): Style applied to every chunk.
+        chunk_rows (int, optional): Body rows per chunk. Defaults to TABLE_CHUNK_ROWS.
+
+    Returns:
+        list: The LongTable flowables, in order.
+    """
+    chunk_rows = chunk_rows or TABLE_CHUNK_ROWS
+    header, rows = table_data[0], table_data[1:]
+    tables = []
+    for start in range(0, len(rows), chunk_rows):
+        table = LongTable([header] + rows[start:start + chunk_rows], colWidths=col_widths, repeatRows=1)
+        table.setStyle(table_style)
+        tables.append(table)
+    return tables
+
+
 def load_asset_criticality_scores(acs_file_path):
     """
     Load Asset Criticality Scores from a CSV file.
@@ -111,11 +408,11 @@ def load_asset_criticality_scores(acs_file_path):
         logger.info("ACS file not found. All ACS values will default to 1.")
         return {}
     try:
-        acs_df = pd.read_csv(acs_file_path, comment='#')
-        # Ensure ACS is an integer between 1 and 5
-        acs_df['ACS'] = pd.to_numeric(acs_df['ACS'], errors='coerce').fillna(1).astype(int)
-        acs_df['ACS'] = acs_df['ACS'].clip(lower=1, upper=5)
-        acs_dict = pd.Series(acs_df.ACS.values, index=acs_df.IP).to_dict()
+        acs_df = pd.read_csv(acs_file_path, comment='#', usecols=['IP', 'ACS'], dtype={'IP': 'string'})
+        # Ensure ACS is an integer between 1 and 5, clipping before the cast so int8 cannot overflow
+        acs_values = pd.to_numeric(acs_df['ACS'], errors='coerce').fillna(1).to_numpy()
+        acs_values = np.clip(acs_values, 1, 5).astype(np.int8)
+        acs_dict = dict(zip(acs_df['IP'].to_numpy(), acs_values.tolist()))
         logger.info(f"Loaded ACS for {len(acs_dict)} hosts.")
         return acs_dict
     except Exception as e:
@@ -127,107 +424,52 @@ def parse_metasploit_report(report_path):
     """
     Parse the Metasploit TXT report and extract exploitation data.
 
+    The report is split where each exploited CVE starts, and every section is matched
+    with one regular expression that captures all of its fields.
+
     Args:
         report_path (str): Path to the Metasploit TXT report.
 
     Returns:
         dict: A dictionary containing exploited CVEs, exploit details, payload statistics, and CVEs without exploits.
     """
-    exploited_cves = []
-    cves_without_exploits = []
-    total_cves_examined = 0
-    total_exploited = 0
-    incompatible_cves = 0
-
-    # Regular expressions to match relevant lines
-    cve_found_re = re.compile(r"\[(.*?)\] Exploitable CVE Found: (CVE-\d{4}-\d+)")
-    exploit_identified_re = re.compile(r"\[(.*?)\] Identified Exploit: (.+)")
-    target_ip_re = re.compile(r"Target IP: (\d+\.\d+\.\d+\.\d+)")
-    target_port_re = re.compile(r"Target Port: (\d+)")
-    payload_stats_re = re.compile(r"Payload Statistics:")
-    summary_re = re.compile(r"Total CVEs examined: (\d+)\s+Total exploited CVEs: (\d+)\s+Incompatible CVEs: (\d+)")
-
-    current_exploit = {}
-    payload_total = payload_successful = payload_failed = None
-    capturing_payload_stats = False
-    in_cve_without_exploits_section = False
-
-    with open(report_path, 'r') as file:
-        for line in file:
-            line = line.strip()
-
-            # Detect the section listing CVEs without exploits
-            if "The following CVEs were detected, but Metasploit does not have an exploit to target these." in line:
-                in_cve_without_exploits_section = True
-                # Skip the next line (the one that says "Search results from ExploitDB...")
-                next(file, None)
-                continue
-
-            if in_cve_without_exploits_section:
-                # Detect end of the CVEs section
-                if line.startswith("End of Report Summary"):
-                    in_cve_without_exploits_section = False
-                    continue
-                # Check if the line starts with 'CVE-'
-                if line.startswith("CVE-"):
-                    cves_without_exploits.append(line)
-                continue
-
-            # Check for Exploitable CVE Found
-            cve_found_match = cve_found_re.search(line)
-            if cve_found_match:
-                current_exploit['cve'] = cve_found_match.group(2)
-                continue
-
-            # Check for Identified Exploit
-            exploit_identified_match = exploit_identified_re.search(line)
-            if exploit_identified_match:
-                current_exploit['exploit'] = exploit_identified_match.group(2)
-                continue
-
-            # Check for Target IP
-            target_ip_match = target_ip_re.search(line)
-            if target_ip_match:
-                current_exploit['target_ip'] = target_ip_match.group(1)
-                continue
-
-            # Check for Target Port
-            target_port_match = target_port_re.search(line)
-            if target_port_match:
-                current_exploit['target_port'] = target_port_match.group(1)
-                continue
-
-            # Check for Payload Statistics
-            if payload_stats_re.search(line):
-                capturing_payload_stats = True
-                continue
-
-            if capturing_payload_stats:
-                if line.startswith("Total:"):
-                    payload_total = int(line.split("Total:")[1].strip())
-                elif line.startswith("Successful:"):
-                    payload_successful = int(line.split("Successful:")[1].strip())
-                elif line.startswith("Failed:"):
-                    payload_failed = int(line.split("Failed:")[1].strip())
-                    # After capturing all payload stats, append the exploit
-                    if current_exploit:
-                        current_exploit['payload_total'] = payload_total
-                        current_exploit['payload_successful'] = payload_successful
-                        current_exploit['payload_failed'] = payload_failed
-                        exploited_cves.append(current_exploit.copy())
-                        current_exploit = {}
-                        # Reset payload stats
-                        payload_total = payload_successful = payload_failed = None
-                        capturing_payload_stats = False
-                continue
-
-            # Check for Summary
-            summary_match = summary_re.search(line)
-            if summary_match:
-                total_cves_examined = int(summary_match.group(1))
-                total_exploited = int(summary_match.group(2))
-                incompatible_cves = int(summary_match.group(3))
-                continue
+    # The regexes scan the mapped report in place, and only the captured values are copied and decoded.
+    # mmap refuses empty files, so an empty report is scanned as empty bytes
+    with open(report_path, 'rb') as file, (
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if os.fstat(file.fileno()).st_size
+        else nullcontext(b"")
+    ) as report_map:
+        # Each section runs from one exploited CVE to the next and is searched within those bounds
+        section_starts = [match.start() for match in EXPLOIT_SECTION_START_RE.finditer(report_map)]
+        section_ends = section_starts[1:] + [len(report_map)]
+
+        exploited_cves = []
+        for section_start, section_end in zip(section_starts, section_ends):
+            exploit_match = EXPLOIT_BLOCK_RE.search(report_map, section_start, section_end)
+            # Sections without an exploit, or cut short before the payload statistics, are skipped
+            if exploit_match:
+                exploited_cves.append({
+                    'cve': exploit_match['cve'].decode(),
+                    'exploit': exploit_match['exploit'].strip().decode(errors='replace'),
+                    'target_ip': exploit_match['target_ip'].strip().decode(),
+                    'target_port': exploit_match['target_port'].strip().decode(),
+                    'payload_total': int(exploit_match['payload_total']),
+                    'payload_successful': int(exploit_match['payload_successful']),
+                    'payload_failed': int(exploit_match['payload_failed']),
+                })
+
+        cves_without_exploits = []
+        no_exploit_match = NO_EXPLOIT_SECTION_RE.search(report_map)
+        if no_exploit_match:
+            cves_without_exploits = [
+                cve.decode(errors='replace') for cve in NO_EXPLOIT_CVE_RE.findall(no_exploit_match['section'])
+            ]
+
+        total_cves_examined = total_exploited = incompatible_cves = 0
+        summary_match = METASPLOIT_SUMMARY_RE.search(report_map)
+        if summary_match:
+            total_cves_examined, total_exploited, incompatible_cves = map(int, summary_match.groups())
 
     parsed_data = {
         "exploited_cves": exploited_cves,
@@ -240,27 +482,68 @@ def parse_metasploit_report(report_path):
     return parsed_data
 
 
+def encode_historical_record(record):
+    """
+    Encode one historical scan record as a line of the JSON Lines history file.
+
+    Args:
+        record (dict): Historical scan record.
+
+    Returns:
+        bytes: The record as compact JSON, followed by a newline.
+    """
+    if orjson:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode()
+
+
 def load_historical_data(file_path):
     """
-    Load historical scan counts from a JSON file.
+    Load historical scan counts from a JSON Lines file, one scan record per line.
+
+    A JSON array file from earlier versions, with the same name ending in .json,
+    is converted to the JSON Lines file the first time it is found.
 
     Args:
-        file_path (str): Path to the JSON file.
+        file_path (str): Path to the JSON Lines file.
 
     Returns:
         list: List of historical scan records.
     """
     if not os.path.exists(file_path):
+        legacy_path = os.path.splitext(file_path)[0] + ".json"
+        if os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, 'rb') as f:
+                    data = orjson.loads(f.read()) if orjson else json.load(f)
+                save_historical_data(file_path, data)
+                logger.info(f"Converted {len(data)} historical records from {legacy_path} to {file_path}.")
+                return data
+            except Exception as e:
+                logger.error(f"Failed to convert historical data from {legacy_path}: {e}")
+                return []
         logger.info(f"Historical data file not found. Creating a new one at {file_path}.")
         return []
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            logger.info(f"Loaded {len(data)} historical records.")
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        cached = HISTORICAL_DATA_CACHE.get(file_path)
+        if cached and cached[0] == mtime_ns:
+            data = list(cached[1])  # Copy, as callers append to the returned list
+            logger.info(f"Loaded {len(data)} historical records from cache.")
             return data
-    except json.JSONDecodeError:
-        logger.error(f"JSON decode error. The file {file_path} might be corrupted.")
-        return []
+        data = []
+        with open(file_path, 'rb') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data.append(orjson.loads(line) if orjson else json.loads(line))
+                except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+                    # A line cut short by an interrupted write loses only that record
+                    logger.error(f"JSON decode error on line {line_number} of {file_path}, skipping the record.")
+        logger.info(f"Loaded {len(data)} historical records.")
+        HISTORICAL_DATA_CACHE[file_path] = (mtime_ns, list(data))
+        return data
     except Exception as e:
         logger.error(f"Failed to load historical data: {e}")
         return []
@@ -268,21 +551,22 @@ def load_historical_data(file_path):
 
 def save_historical_data(file_path, data):
     """
-    Save historical scan counts to a JSON file.
+    Save historical scan counts to a JSON Lines file, replacing its contents.
 
     Args:
-        file_path (str): Path to the JSON file.
+        file_path (str): Path to the JSON Lines file.
         data (list): List of historical scan records.
     """
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        with open(file_path, 'wb') as f:
+            f.write(b"".join(encode_historical_record(record) for record in data))
             logger.info(f"Saved {len(data)} records to {file_path}.")
+        HISTORICAL_DATA_CACHE[file_path] = (os.stat(file_path).st_mtime_ns, list(data))
     except Exception as e:
         logger.error(f"Failed to save historical data: {e}")
 
 
-def append_scan_result(data, high_count, medium_count, low_count, timestamp=None):
+def append_scan_result(data, high_count, medium_count, low_count, timestamp=None, file_path=None):
     """
     Append a new scan result to the historical data.
 
@@ -292,12 +576,14 @@ def append_scan_result(data, high_count, medium_count, low_count, timestamp=None
         medium_count (int): Number of medium-severity vulnerabilities.
         low_count (int): Number of low-severity vulnerabilities.
         timestamp (str, optional): Specific timestamp for the scan. If None, current time is used.
+        file_path (str, optional): JSON Lines file the new record is also appended to, without
+            rewriting the existing records. If None, the file is left unchanged.
 
     Returns:
         list: Updated historical data.
     """
     if timestamp is None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.now().strftime(HISTORICAL_TIMESTAMP_FORMAT)
     new_entry = {
         "timestamp": timestamp,
         "high_count": high_count,
@@ -306,9 +592,129 @@ def append_scan_result(data, high_count, medium_count, low_count, timestamp=None
     }
     data.append(new_entry)
     logger.info(f"Appended new scan result at {timestamp}.")
+
+    if file_path is not None:
+        try:
+            with open(file_path, 'ab') as f:
+                f.write(encode_historical_record(new_entry))
+            HISTORICAL_DATA_CACHE[file_path] = (os.stat(file_path).st_mtime_ns, list(data))
+            logger.info(f"Appended scan result to {file_path}.")
+        except Exception as e:
+            logger.error(f"Failed to save historical data: {e}")
     return data
 
 
+def save_donut_chart(chart_path, sizes, labels, colors_list, title, legend_title):
+    """
+    Generate a donut chart with a legend for the PDF report and save it as an image.
+
+    Each chart is drawn on its own Figure created without pyplot, so several charts
+    can be drawn on separate threads.
+
+    Args:
+        chart_path (str or file-like): Path or binary buffer where the chart image will be saved.
+        sizes (list): Size of each slice.
+        labels (list): Label of each slice.
+        colors_list (list): Color of each slice.
+        title (str): Title of the chart.
+        legend_title (str): Title of the legend.
+    """
+    fig = Figure(figsize=(3.5, 3.5))
+    ax = fig.subplots()
+
+    # Draw the ring slices directly as Wedge patches, counterclockwise from 12 o'clock like ax.pie,
+    # each labelled just outside the ring; the inner 0.6 radius is left empty to make it a donut
+    wedges = []
+    total = sum(sizes)
+    start_angle = 90.0
+    for size, label, color in zip(sizes, labels, colors_list):
+        end_angle = start_angle + 360.0 * size / total
+        wedge = Wedge((0, 0), 1, start_angle, end_angle, width=0.4, facecolor=color, edgecolor="white",
+                      clip_on=False, label=label)
+        ax.add_patch(wedge)
+        wedges.append(wedge)
+
+        mid_angle = np.deg2rad((start_angle + end_angle) / 2)
+        label_x, label_y = 1.1 * np.cos(mid_angle), 1.1 * np.sin(mid_angle)
+        ax.text(label_x, label_y, label, ha="left" if label_x > 0 else "right", va="center",
+                color="black", fontsize=10, clip_on=False)
+        start_angle = end_angle
+
+    ax.set(frame_on=False, xticks=[], yticks=[], xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+
+    # Set the title and legend
+    ax.set_title(title, fontsize=12, fontweight="bold", pad=15)
+    ax.legend(
+        wedges,
+        labels,
+        title=legend_title,
+        loc="center left",
+        bbox_to_anchor=(1, 0, 0.5, 1),
+        fontsize=10,
+    )
+
+    ax.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle
+
+    # Save the pie chart image, reduced to a small palette as it holds only a few flat colors
+    # and their anti-aliased edges; this shrinks the image ReportLab embeds in the PDF
+    rendered_chart = io.BytesIO()
+    fig.savefig(rendered_chart, bbox_inches="tight", dpi=REPORT_CHART_DPI, pil_kwargs=REPORT_CHART_PNG_OPTIONS)
+    rendered_chart.seek(0)
+    with PILImage.open(rendered_chart) as chart_image:
+        chart_image.convert("RGB").quantize(colors=REPORT_CHART_PALETTE_COLORS).save(
+            chart_path, format="PNG", **REPORT_CHART_PNG_OPTIONS
+        )
+
+
+def save_gui_pie_chart(chart_path, sizes, labels, colors_list):
+    """
+    Generate a small pie chart with a transparent background for the GUI result section.
+
+    Charts are cached in GUI_CHART_CACHE_DIR by a hash of their inputs, so a chart with
+    the same counts as an earlier run is copied rather than drawn again.
+
+    Args:
+        chart_path (str): Path where the chart image will be saved.
+        sizes (list): Size of each slice.
+        labels (list): Label of each slice, shown in the legend.
+        colors_list (list): Color of each slice.
+    """
+    cache_key = hashlib.blake2b(repr((sizes, labels, colors_list)).encode(), digest_size=8).hexdigest()
+    cache_path = os.path.join(GUI_CHART_CACHE_DIR, f"{cache_key}.png")
+    if os.path.exists(cache_path):
+        shutil.copyfile(cache_path, chart_path)
+        return
+
+    # Adjust the figure size to provide more room for the legend
+    fig = Figure(figsize=(3.12, 1.96))
+    ax = fig.subplots()
+
+    # Create the pie chart, with no slice explode
+    ax.pie(sizes, labels=None, colors=colors_list, autopct=lambda p: f'{round(p * sum(sizes) / 100)}',
+           startangle=90, explode=(0,) * len(sizes), textprops={'fontsize': 8})
+
+    fig.patch.set_alpha(0)  # Makes the background transparent
+
+    # Create custom legend with circle markers and no lines
+    legend_elements = [Line2D([0], [0], marker='o', color='w', label=label, markersize=7,
+                              markerfacecolor=color, linestyle='None')
+                       for label, color in zip(labels, colors_list)]
+
+    # Place the legend closer to the pie chart
+    legend = ax.legend(handles=legend_elements, loc='center left', bbox_to_anchor=(0.85, 0.5), frameon=False,
+                       fontsize=8)
+
+    for text in legend.get_texts():
+        text.set_color("white")
+
+    fig.savefig(chart_path, bbox_inches="tight")
+
+    # Store the chart in the cache under a temporary name first, so a partial file is never used
+    os.makedirs(GUI_CHART_CACHE_DIR, exist_ok=True)
+    shutil.copyfile(chart_path, f"{cache_path}.tmp")
+    os.replace(f"{cache_path}.tmp", cache_path)
+
+
 def generate_line_graph(data, graph_path):
     """
     Generate a line graph from historical scan data.
@@ -316,15 +722,31 @@ def generate_line_graph(data, graph_path):
     Args:
         data (list): Historical scan data.
         graph_path (str): Path to save the generated graph.
+
+    Returns:
+        bool: True if the graph was saved, False otherwise.
     """
     if len(data) < 2:
         logger.info("Not enough data points to generate a line graph. Skipping graph generation.")
 
     # Convert data to DataFrame for easier plotting
     df = pd.DataFrame(data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    # append_scan_result always writes this format, so pandas does not have to infer it
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format=HISTORICAL_TIMESTAMP_FORMAT, cache=True)
     df.sort_values('timestamp', inplace=True)
 
+    # A long history is averaged per day, and only the most recent days are kept,
+    # so the number of plotted points does not grow with every scan
+    if len(df) > HISTORICAL_GRAPH_MAX_POINTS:
+        df = (
+            df.set_index('timestamp')[['high_count', 'medium_count', 'low_count']]
+            .resample('1D')
+            .mean()
+            .dropna()
+            .tail(HISTORICAL_GRAPH_MAX_POINTS)
+            .reset_index()
+        )
+
     plt.figure(figsize=(6.75, 3.375))
 
     high_color = '#d43f3a'
@@ -369,17 +791,834 @@ def generate_line_graph(data, graph_path):
     plt.tight_layout()
 
     try:
-        plt.savefig(graph_path, bbox_inches="tight", dpi=300)
+        plt.savefig(graph_path, bbox_inches="tight", dpi=REPORT_CHART_DPI, pil_kwargs=REPORT_CHART_PNG_OPTIONS)
         plt.close()
         logger.info(f"Line graph generated and saved to {graph_path}.")
+        return True
     except Exception as e:
-        logger.eror(f"Failed to save line graph: {e}")
+        logger.error(f"Failed to save line graph: {e}")
+        return False
+
+
+# -------------------- #
+#    Report Styles     #
+# -------------------- #
+
+# Styles, tables and texts that are the same in every report are built once at import.
+# Flowables such as Paragraph and Table keep layout state, so those are still created per report
+_sample_styles = getSampleStyleSheet()
+BODY_STYLE = _sample_styles["BodyText"]
+HEADING_STYLE = _sample_styles["Heading1"]
+HEADING_STYLE.fontSize = 15
+HEADING_STYLE.leading = 17
+TITLE_STYLE = _sample_styles["Title"]
+
+# Centered paragraph style
+CENTERED_STYLE = ParagraphStyle(
+    name="Centered",
+    alignment=1,  # Center the text
+    fontSize=10,
+    leading=14,  # Line height
+    fontName="Helvetica",
+)
+
+# Confidentiality note in italicized font
+CONFIDENTIALITY_STYLE = ParagraphStyle(
+    name="Confidentiality",
+    fontSize=9,
+    textColor=colors.HexColor("#666666"),
+    fontName="Helvetica-Oblique",
+    leading=12,
+)
+
+# Report summary style
+REP_SUMMARY_STYLE = ParagraphStyle(
+    name="Centered",
+    fontSize=10,
+    leading=14,  # Line height
+    fontName="Helvetica",
+)
+
+# Table of Contents title style
+TOC_TITLE_STYLE = ParagraphStyle(
+    name="TOCTitle",
+    fontSize=10,
+    fontName="Helvetica-Bold",
+    alignment=1,  # Centered text
+    spaceAfter=12,  # Space after the title
+)
+
+# Table of Contents entries and the page each section starts on
+TOC_ENTRIES = [
+    ("Executive Summary", "2"),
+    ("Key Findings", "2"),
+    ("Top 10 Vulnerabilities", "3"),
+    ("Recommendations", "4"),
+    ("Conclusion", "4"),
+    ("Appendix 1: Definitions", "4"),
+    ("Appendix 2: Recommended Actions to be Taken Based on Vulnerability Severity", "5"),
+    ("Appendix 3: Host-Level Vulnerability Metrics", "6"),
+    ("Appendix 4: Detailed Tool Results", "7"),
+]
+TOC_FONT_NAME = "Helvetica"
+TOC_FONT_SIZE = 8
+TOC_COL_WIDTHS = [5.7 * inch, 1 * inch]
+
+TOC_DATA = [
+    [toc_leader_text(title, TOC_COL_WIDTHS[0] - 12, TOC_FONT_NAME, TOC_FONT_SIZE), page]  # 6pt cell padding each side
+    for title, page in TOC_ENTRIES
+]
+
+TOC_TABLE_STYLE = TableStyle(
+    [
+        (
+            "ALIGN",
+            (0, 0),
+            (0, -1),
+            "LEFT",
+        ),  # Left-align the first column (section titles)
+        ("ALIGN", (1, 0), (1, -1), "RIGHT"),  # Right-align the page numbers
+        ("FONTNAME", (0, 0), (-1, -1), TOC_FONT_NAME),
+        ("FONTSIZE", (0, 0), (-1, -1), TOC_FONT_SIZE),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+    ]
+)
+
+# Executive summary and conclusion, filled in with the counts of each report.
+# The executive summary is chosen by the number of high vulnerabilities: 5 or more, 1 to 4, or none
+EXEC_SUMMARY_HIGH_RISK_TEXT = (
+    "The purpose of this security assessment was to identify weaknesses within our IT infrastructure "
+    "that could be exploited by attackers, potentially leading to financial loss, regulatory penalties, "
+    "or damage to our reputation. Of the {hosts_scanned} hosts scanned, {total_vulns} vulnerabilities were found, "
+    "with {high_vulns} categorized as high, posing the most significant risk. "
+    "Immediate remediation of any high vulnerabilities "
+    "identified is necessary to avoid potential business disruptions and ensure the continued trust of our customers. "
+    "This report provides detailed findings and actionable recommendations to mitigate these risks, safeguarding your operations."
+)
+
+EXEC_SUMMARY_MODERATE_RISK_TEXT = (
+    "The security assessment identified several areas of concern within the IT infrastructure. "
+    "Out of {hosts_scanned} hosts scanned, {total_vulns} vulnerabilities were found, "
+    "with {high_vulns} categorized as high severity. "
+    "Timely remediation of identified vulnerabilities is recommended to enhance the security posture. "
+    "This report provides detailed findings and actionable recommendations to address these risks."
+)
+
+EXEC_SUMMARY_LOW_RISK_TEXT = (
+    "The security assessment indicates a relatively low level of risk within the IT infrastructure. "
+    "Out of {hosts_scanned} hosts scanned, {total_vulns} vulnerabilities were identified, "
+    "with {high_vulns} categorized as high severity. "
+    "While immediate risk is low, addressing identified vulnerabilities will help maintain and improve your security posture. "
+    "This report provides detailed findings and recommendations for ongoing security enhancements."
+)
+
+CONCLUSION_TEXT = (
+    "In conclusion, the assessment identified a total of {total_vulns} vulnerabilities "
+    "across {hosts_scanned} hosts, with {high_vulns} high-risk, {medium_vulns} medium-risk, and "
+    "{low_vulns} low-risk vulnerabilities. The presence of high-risk vulnerabilities indicates a significant "
+    "threat to the organisation. Immediate action is required to remediate high-risk vulnerabilities to prevent "
+    "potential breaches that could lead to financial, reputational, or regulatory damages."
+)
+
+RECOMMENDATIONS_TEXT = (
+    "Immediately address any critical vulnerabilities, continue to perform regular security assessments, "
+    "and allocate resources to strengthen the security posture of our organization. "
+    "We strongly recommend establishing a continuous vulnerability management program, including regular security "
+    "assessments and timely remediation of any identified high-risk vulnerabilities. By proactively managing vulnerabilities, "
+    "the organisation can significantly reduce risk and ensure compliance with industry regulations and best practices. "
+    "In addition, it is highly advisable to leverage robust security tools to verify these findings and validate remediation efforts. "
+    "Tools like Tenable Nessus, Qualys, and Rapid7 InsightVM are industry-standard vulnerability scanners that can provide a secondary layer of assurance. "
+    "Furthermore, manual exploitation of CVEs that were identified is recommended."
+)
+
+# Introductions of the report sections and appendices
+TOP_10_TEXT = (
+    "The following table details the top 10 most critical vulnerabilities identified in the scan. It is ordered from "
+    "most significant risk to least significant risk, with a CVSS score of 10.0 being the highest score possible "
+    "awarded to vulnerabilities that pose a major risk. Please refer to the definitions table in the appendix "
+    "if any of the terms are unknown to you."
+)
+
+RECOMMENDED_ACTIONS_TEXT = (
+    "The following table outlines the recommended actions that should be taken based on vulnerability severity. "
+    "It serves as a point of reference when analysing the report so when, for example, you discover a high vulnerability "
+    "you can refer to this table to determine what actions should be taken."
+)
+
+HOST_METRICS_TEXT = (
+    "This section provides a detailed analysis of vulnerability metrics at the host level. "
+    "Specifically, it includes the median and maximum CVSS (Common Vulnerability Scoring System) scores for each host identified during the assessment. "
+    "The median CVSS score offers a robust average that minimises the impact of outliers, while the maximum CVSS score highlights the most severe vulnerability present on each host. "
+    "By presenting average CVSS scores per host, this section helps prioritise remediation efforts by identifying the most vulnerable systems in the network. "
+    "It offers actionable insights into which hosts require immediate attention based on their overall risk profile."
+)
+
+NIKTO_TEXT = (
+    "The following table presents the results from the Nikto scan, detailing web service/application based vulnerabilities "
+    "identified during the assessment."
+)
+
+NUCLEI_TEXT = (
+    "The following table presents the results from the Nuclei scan, detailing vulnerabilities "
+    "identified during the assessment."
+)
+
+# Terms explained in Appendix 1
+DEFINITIONS = [
+    (
+        "CVE (Common Vulnerabilities and Exposure)",
+        "A list of publicly disclosed computer security flaws, each identified by a unique number called a CVE ID.",
+    ),
+    (
+        "Severity",
+        "The level of impact that a vulnerability could have on the organisation, categorised as High, Medium, or Low with high being the most critical, etc.",
+    ),
+    (
+        "Exploit",
+        "A piece of code or technique that takes advantage of a vulnerability to compromise a system.",
+    ),
+    (
+        "Vulnerability",
+        "A weakness in a system that can be exploited by an attacker to perform malicious actions.",
+    ),
+    (
+        "Vulnerability Scan",
+        "Automated process that identifies, evaluates, and reports potential security weaknesses in an organisation’s IT systems.",
+    ),
+    (
+        "DID (Detection ID)",
+        "Detection ID (DID) is a unique identifier assigned to each individual occurrence of a vulnerability on a specific asset.",
+    ),
+    (
+        "Quality of Detection (QoD)",
+        "A metric used in OpenVAS scanning to represent the confidence level or reliability of a detected vulnerability. QoD values are expressed as percentages, with higher percentages indicating greater confidence in the accuracy of the detection.",
+    ),
+    (
+        "Asset Criticality Score (ACS)",
+        "A numerical value from 1 to 5 assigned to an asset to indicate its importance or criticality to the organisation. Higher scores denote higher criticality, which may warrant prioritising remediation efforts. For example, an asset with a criticality score of 5 is a highly critical asset and should be prioritised accordingly. The default ACS is 1. ",
+    ),
+]
+
+# Column widths of the vulnerability definitions table
+DEFINITIONS_TABLE_COL_WIDTHS = [2.3 * inch, 4.4 * inch]
+
+# Style shared by the definitions and recommended actions appendix tables
+APPENDIX_TABLE_STYLE = TableStyle(
+    [
+        (
+            "BACKGROUND",
+            (0, 0),
+            (-1, 0),
+            HEADER_BACKGROUND_COLOR,
+        ),  # Blue background for the header row
+        (
+            "TEXTCOLOR",
+            (0, 0),
+            (-1, 0),
+            colors.whitesmoke,
+        ),  # White text color for the header row
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),  # Left-align text
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+        ("TOPPADDING", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (1, 0), (-1, -1), 8),
+        ("TOPPADDING", (1, 0), (-1, -1), 8),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),  # Black grid lines
+        (
+            "BOX",
+            (0, 0),
+            (-1, -1),
+            0.75,
+            colors.black,
+        ),  # Thicker border around the table
+    ]
+)
+
+# Manually alternate row background colors for the appendix tables
+add_row_stripes(APPENDIX_TABLE_STYLE)
+
+# Recommended actions per severity for Appendix 2
+RECOMMENDED_ACTIONS = [
+    (
+        "High",
+        "Vulnerabilities that pose an immediate threat to the organisation and could lead to significant business impact if exploited.",
+        "1. Immediate remediation within 24 hours.<br/>2. Apply security patches or mitigations.<br/>3. Increase monitoring on affected systems.<br/>4. Notify relevant stakeholders.",
+    ),
+    (
+        "Medium",
+        "Vulnerabilities that have a moderate impact and could lead to significant issues if left unaddressed.",
+        "1. Remediate within 7 days.<br/>2. Apply available patches or mitigations.<br/>3. Monitor for signs of exploitation.",
+    ),
+    (
+        "Low",
+        "Vulnerabilities that have a minor impact and are less likely to be exploited but should still be addressed.",
+        "1. Remediate within 30 days.<br/>2. Apply patches as part of regular maintenance.<br/>3. Monitor the situation to ensure no escalation.",
+    ),
+]
+
+# Column widths of the recommended actions table
+ACTIONS_TABLE_COL_WIDTHS = [1.2 * inch, 2.5 * inch, 3 * inch]
+
+# Column widths of the detailed vulnerability list tables
+DETAILED_VULNS_TABLE_COL_WIDTHS = [1.2 * inch, 0.5 * inch, 0.7 * inch, 1.9 * inch, 0.5 * inch, 1.9 * inch]
+
+# Style of the detailed vulnerability list tables
+DETAILED_VULNS_TABLE_STYLE = TableStyle(
+    [
+        (
+            "BACKGROUND",
+            (0, 0),
+            (-1, 0),
+            HEADER_BACKGROUND_COLOR,
+        ),  # Blue background for the header row
+        (
+            "TEXTCOLOR",
+            (0, 0),
+            (-1, 0),
+            colors.whitesmoke,
+        ),  # White text color for the header row
+        (
+            "ALIGN",
+            (0, 0),
+            (-1, -1),
+            "LEFT",
+        ),  # Left-align text for better readability
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        (
+            "FONTSIZE",
+            (0, 0),
+            (-1, -1),
+            10,
+        ),  # Slightly reduced font size for better fit
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 10),  # Added padding
+        ("TOPPADDING", (0, 0), (-1, 0), 10),  # Added padding
+        ("BOTTOMPADDING", (1, 0), (-1, -1), 8),
+        ("TOPPADDING", (1, 0), (-1, -1), 8),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),  # Added padding
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),  # Added padding
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),  # Black grid lines
+        (
+            "BOX",
+            (0, 0),
+            (-1, -1),
+            0.75,
+            colors.black,
+        ),  # Thicker border around the table
+        (
+            "VALIGN",
+            (0, 0),
+            (-1, -1),
+            "TOP",
+        ),  # Align text to the top of each cell
+    ]
+)
+add_row_stripes(DETAILED_VULNS_TABLE_STYLE)
+
+# Columns of the Nikto results tables, which are also their header row, and their widths
+NIKTO_TABLE_COLUMNS = ["Host", "DID", "Port", "Reference", "Description"]
+NIKTO_TABLE_COL_WIDTHS = [1.2 * inch, 0.5 * inch, 0.5 * inch, 1.5 * inch, 3 * inch]
+
+# Style of the Nikto results tables
+NIKTO_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), HEADER_BACKGROUND_COLOR),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+        ("TOPPADDING", (0, 0), (-1, 0), 10),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]
+)
+add_row_stripes(NIKTO_TABLE_STYLE)
+
+
+# Cell sizes of the High/Medium/Low vulnerability counts table
+VULN_COUNTS_TABLE_COL_WIDTHS = [2.25 * inch] * 3
+VULN_COUNTS_TABLE_ROW_HEIGHTS = [0.75 * inch, 0.3 * inch]
+
+# Style of the High/Medium/Low vulnerability counts table
+VULN_COUNTS_TABLE_STYLE = TableStyle(
+    [
+        (
+            "BACKGROUND",
+            (0, 0),
+            (0, 0),
+            colors.HexColor("#E74C3C"),
+        ),  # Red background for High
+        (
+            "BACKGROUND",
+            (1, 0),
+            (1, 0),
+            colors.HexColor("#F39C12"),
+        ),  # Orange background for Medium
+        (
+            "BACKGROUND",
+            (2, 0),
+            (2, 0),
+            colors.HexColor("#2ECC71"),
+        ),  # Green background for Low
+        (
+            "TEXTCOLOR",
+            (0, 0),
+            (-1, 0),
+            colors.whitesmoke,
+        ),  # White text color for counts
+        (
+            "TEXTCOLOR",
+            (0, 1),
+            (-1, 1),
+            colors.whitesmoke,
+        ),  # White text color for labels
+        (
+            "ALIGN",
+            (0, 0),
+            (-1, -1),
+            "CENTER",
+        ),  # Center-align text in all cells
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),  # Middle vertical alignment
+        (
+            "FONTNAME",
+            (0, 0),
+            (-1, 0),
+            "Helvetica",
+        ),  # Regular font for counts
+        ("FONTSIZE", (0, 0), (-1, 0), 18),  # Large font for counts
+        ("FONTNAME", (0, 1), (-1, 1), "Helvetica-Bold"),  # Bold font for labels
+        ("FONTSIZE", (0, 1), (-1, 1), 8),  # Small font for labels
+        (
+            "BACKGROUND",
+            (0, 1),
+            (0, 1),
+            HEADER_BACKGROUND_COLOR,
+        ),  # Dark background for labels
+        (
+            "BACKGROUND",
+            (1, 1),
+            (1, 1),
+            HEADER_BACKGROUND_COLOR,
+        ),  # Dark background for labels
+        (
+            "BACKGROUND",
+            (2, 1),
+            (2, 1),
+            HEADER_BACKGROUND_COLOR,
+        ),  # Dark background for labels
+        (
+            "BOX",
+            (0, 0),
+            (-1, -1),
+            0.75,
+            colors.whitesmoke,
+        ),  # Thicker border around the table
+    ]
+)
+
+# Heading above the vulnerability counts table
+VULN_COUNT_HEADING_STYLE = ParagraphStyle(
+    name="Heading1",
+    fontSize=10,
+    alignment=0,  # Aligned-left
+    textColor=colors.black,
+    spaceAfter=12,  # Space after the heading
+    fontName="Helvetica",
+)
+
+# Column widths of the two pie charts shown side by side
+CHART_TABLE_COL_WIDTHS = [2.875 * inch] * 2
+
+# Padding around the two pie charts shown side by side
+CHART_TABLE_STYLE = TableStyle(
+    [
+        ("LEFTPADDING", (0, 0), (-1, -1), 12),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+        ("TOPPADDING", (0, 0), (-1, -1), 12),
+    ]
+)
+
+# Column width of the historical line graph table
+HISTORICAL_GRAPH_TABLE_COL_WIDTHS = [6.75 * inch]
+
+# The historical line graph fills its table cell without padding
+HISTORICAL_GRAPH_TABLE_STYLE = TableStyle(
+    [
+        ("LEFTPADDING", (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+        ("TOPPADDING", (0, 0), (-1, -1), 0),
+    ]
+)
+
+# Column widths of the top 10 vulnerabilities table
+TOP_VULNS_TABLE_COL_WIDTHS = [1.3 * inch, 0.5 * inch, 2.6 * inch, 2.3 * inch]
+
+# Style of the top 10 vulnerabilities table
+TOP_VULNS_TABLE_STYLE = TableStyle(
+    [
+        (
+            "BACKGROUND",
+            (0, 0),
+            (-1, 0),
+            HEADER_BACKGROUND_COLOR,
+        ),  # Blue background for the header row
+        (
+            "TEXTCOLOR",
+            (0, 0),
+            (-1, 0),
+            colors.whitesmoke,
+        ),  # White text color for the header row
+        (
+            "ALIGN",
+            (0, 0),
+            (-1, -1),
+            "LEFT",
+        ),  # Left-align text for better readability
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),  # Reduced font size for better fit
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+        ("TOPPADDING", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (1, 0), (-1, -1), 8),
+        ("TOPPADDING", (1, 0), (-1, -1), 8),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),  # Black grid lines
+        (
+            "BOX",
+            (0, 0),
+            (-1, -1),
+            0.75,
+            colors.black,
+        ),  # Thicker border around the table
+        (
+            "VALIGN",
+            (0, 0),
+            (-1, -1),
+            "TOP",
+        ),  # Align text to the top of each cell
+    ]
+)
+add_row_stripes(TOP_VULNS_TABLE_STYLE)
+
+# Column widths of the host metrics table
+HOST_METRICS_TABLE_COL_WIDTHS = [0.5 * inch, 1.3 * inch, 1.1 * inch, 1.1 * inch, 1 * inch, 0.5 * inch, 0.7 * inch, 0.5 * inch]
+
+# Column widths of the Nuclei results table
+NUCLEI_TABLE_COL_WIDTHS = [1.75 * inch, 1.0 * inch, 1.0 * inch, 2.9 * inch]
+
+# Style of the Nuclei results table
+NUCLEI_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), HEADER_BACKGROUND_COLOR),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+        ("TOPPADDING", (0, 0), (-1, 0), 10),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]
+)
+add_row_stripes(NUCLEI_TABLE_STYLE)
+
+# Column widths of the exploited CVEs and CVEs without exploits tables
+EXPLOITED_CVES_TABLE_COL_WIDTHS = [1.2 * inch, 2.1 * inch, 1.2 * inch, 1 * inch, 1.2 * inch]
+CVES_WITHOUT_EXPLOITS_TABLE_COL_WIDTHS = [6.7 * inch]
+
+# Style of the exploited CVEs and CVEs without exploits tables
+METASPLOIT_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), HEADER_BACKGROUND_COLOR),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("TOPPADDING", (0, 0), (-1, 0), 8),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+        ("BOX", (0, 0), (-1, -1), 0.75, colors.black),
+    ]
+)
+add_row_stripes(METASPLOIT_TABLE_STYLE)
+
+# Column widths of the Metasploit summary statistics table
+METASPLOIT_SUMMARY_TABLE_COL_WIDTHS = [2.2 * inch, 2.3 * inch, 2.2 * inch]
+
+# Style of the Metasploit summary statistics table
+METASPLOIT_SUMMARY_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), HEADER_BACKGROUND_COLOR),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("TOPPADDING", (0, 0), (-1, 0), 8),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+        ("BOX", (0, 0), (-1, -1), 0.75, colors.black),
+    ]
+)
+add_row_stripes(METASPLOIT_SUMMARY_TABLE_STYLE)
 
 
 # -------------------- #
 #   Report Generation  #
 # -------------------- #
 
+def build_nikto_appendix(nikto_df):
+    """
+    Build the Nikto scan results appendix of the executive report.
+
+    Args:
+        nikto_df (DataFrame or None): The Nikto scan results, or None if no Nikto scan was run.
+
+    Returns:
+        list: The flowables of the appendix, in order.
+    """
+    styleN = BODY_STYLE
+    styleH = HEADING_STYLE
+    elements = []
+
+    # Appendix: Nikto Scan Results
+    elements.extend(
+        [
+            Spacer(1, 0.5 * inch),
+            Paragraph("Appendix: Nikto Scan Results", styleH),
+            Paragraph(NIKTO_TEXT, styleN),
+            Spacer(1, 0.25 * inch),
+        ]
+    )
+
+    if nikto_df is not None and not nikto_df.empty:
+        # Prepare Nikto data for the table; the port always fits its column, so it is a plain string
+        nikto_rows = escape_paragraph_columns(
+            nikto_df[NIKTO_TABLE_COLUMNS].astype(str),
+            ["Host", "DID", "Reference", "Description"],
+        ).itertuples(index=False, name=None)
+        nikto_table_data = [NIKTO_TABLE_COLUMNS] + [
+            [
+                Paragraph(host, styleN),
+                Paragraph(did[3:], styleN),
+                port,
+                Paragraph(reference, styleN),
+                Paragraph(description, styleN),
+            ]
+            for host, did, port, reference, description in nikto_rows
+        ]
+
+        elements.extend(
+            build_chunked_tables(nikto_table_data, NIKTO_TABLE_COL_WIDTHS, NIKTO_TABLE_STYLE)
+        )
+        elements.append(PageBreak())
+    else:
+        elements.append(Paragraph("No Nikto scan results were provided.", styleN))
+
+    return elements
+
+
+def build_nuclei_appendix(nuclei_combined_output_file):
+    """
+    Build the Nuclei scan results appendix of the executive report.
+
+    Args:
+        nuclei_combined_output_file (str or None): Path to the combined nuclei scan results.
+
+    Returns:
+        list: The flowables of the appendix, in order.
+    """
+    styleN = BODY_STYLE
+    styleH = HEADING_STYLE
+    elements = []
+
+    # Appendix: Nuclei Scan Results
+    elements.extend(
+        [
+            Spacer(1, 0.75 * inch),  # Increased spacing
+            Paragraph("Appendix: Nuclei Scan Results", styleH),
+            Paragraph(NUCLEI_TEXT, styleN),
+            Spacer(1, 0.25 * inch),
+        ]
+    )
+
+    if nuclei_combined_output_file and os.path.exists(nuclei_combined_output_file):
+        with open(nuclei_combined_output_file, "r") as nuclei_file:
+            nuclei_lines = nuclei_file.readlines()
+
+        # Prepare data for the Nuclei table
+        nuclei_table_data = [["Vulnerability", "Protocol", "Severity", "Target"]]
+        for line in nuclei_lines:
+            # Remove any square brackets and extra spaces from the line, and escape it for the Paragraphs
+            line = line.replace("[", "").replace("]", "").strip().translate(PARAGRAPH_ESCAPES)
+            parts = line.split()  # Split the line into parts
+
+            if len(parts) >= 4:
+                nuclei_table_data.append(
+                    [
+                        Paragraph(parts[0], styleN),  # Vulnerability
+                        Paragraph(parts[1], styleN),  # Protocol
+                        Paragraph(parts[2], styleN),  # Severity
+                        Paragraph(" ".join(parts[3:]), styleN),  # Target
+                    ]
+                )
+
+        nuclei_table = Table(
+            nuclei_table_data,
+            colWidths=NUCLEI_TABLE_COL_WIDTHS,
+        )
+
+        nuclei_table.setStyle(NUCLEI_TABLE_STYLE)
+        elements.append(nuclei_table)
+    else:
+        elements.append(Paragraph("No Nuclei scan results were provided.", styleN))
+
+    return elements
+
+
+def build_metasploit_appendix(metasploit_report_path):
+    """
+    Build the Metasploit exploitation results appendix of the executive report.
+
+    The appendix is left out entirely if the Metasploit report is missing or empty.
+
+    Args:
+        metasploit_report_path (str): Path to the Metasploit report.
+
+    Returns:
+        list: The flowables of the appendix, in order.
+    """
+    styleN = BODY_STYLE
+    styleH = HEADING_STYLE
+    elements = []
+
+    # Parse the Metasploit report
+    if os.path.exists(metasploit_report_path):
+        metasploit_data = parse_metasploit_report(metasploit_report_path)
+    else:
+        metasploit_data = None
+        print(colored(f"[WARNING] Metasploit report not found at path: {metasploit_report_path}", "yellow"))
+
+    # Appendix: Metasploit Exploitation Results
+    if metasploit_data:
+        elements.append(PageBreak())
+        elements.append(Paragraph("Appendix: Metasploit Exploitation Results", styleH))
+        metasploit_intro = (
+            "The following sections detail the results of the Metasploit exploitation attempts conducted during the assessment."
+        )
+        elements.append(Paragraph(metasploit_intro, styleN))
+        elements.append(Spacer(1, 0.25 * inch))
+
+        # Table: Exploited CVEs
+        exploited_cves = metasploit_data.get("exploited_cves", [])
+        if exploited_cves:
+            elements.append(Paragraph("Exploited CVEs:", styleH))
+            metasploit_exp_cve = (
+                """The table below enumerates the specific CVEs that were successfully exploited during the assessment. 
+                Each entry provides detailed information about the vulnerability, the exploit utilised, the target IP and port, 
+                and the number of payloads that were successfully deployed. This data underscores the effectiveness of the 
+                exploitation efforts and highlights the critical vulnerabilities that require immediate attention."""
+            )
+
+            elements.append(Paragraph(metasploit_exp_cve, styleN))
+            elements.append(Spacer(1, 0.25 * inch))
+            exploited_data = [["CVE", "Exploit (Metasploit Module)", "Target IP", "Target Port", "Payload Successful",]]
+            for exploit in exploited_cves:
+                exploited_data.append([
+                    Paragraph(exploit.get("cve", "N/A"), styleN),
+                    Paragraph(exploit.get("exploit", "N/A"), styleN),
+                    Paragraph(exploit.get("target_ip", "N/A"), styleN),
+                    Paragraph(exploit.get("target_port", "N/A"), styleN),
+                    Paragraph(str(exploit.get("payload_successful", "N/A")), styleN),
+                ])
+
+            exploited_table = Table(
+                exploited_data,
+                colWidths=EXPLOITED_CVES_TABLE_COL_WIDTHS
+            )
+
+            exploited_table.setStyle(METASPLOIT_TABLE_STYLE)
+            elements.append(exploited_table)
+            elements.append(Spacer(1, 0.25 * inch))
+        else:
+            elements.append(Paragraph("No CVEs were exploited.", styleN))
+            elements.append(Spacer(1, 0.25 * inch))
+
+        # Table: CVEs Without Available Exploits
+        cves_without_exploits = metasploit_data.get("cves_without_exploits", [])
+        if cves_without_exploits:
+            elements.append(Paragraph("CVEs Detected Without Available Exploits:", styleH))
+            metasploit_no_exploit = (
+                """This section provides a list of CVEs for which have no corresponding Metasploit exploit."""
+            )
+            elements.append(Paragraph(metasploit_no_exploit, styleN))
+            elements.append(Spacer(1, 0.25 * inch))
+            cves_without_exploits_data = [["CVE"]]
+            for cve in cves_without_exploits:
+                cves_without_exploits_data.append([Paragraph(cve, styleN)])
+
+            cves_without_table = Table(
+                cves_without_exploits_data,
+                colWidths=CVES_WITHOUT_EXPLOITS_TABLE_COL_WIDTHS
+            )
+
+            cves_without_table.setStyle(METASPLOIT_TABLE_STYLE)
+            elements.append(cves_without_table)
+            elements.append(Spacer(1, 0.25 * inch))
+        else:
+            elements.append(Paragraph("All detected CVEs have available exploits.", styleN))
+            elements.append(Spacer(1, 0.25 * inch))
+
+        # Summary Statistics
+        if metasploit_data:
+            with open('counts.json', 'r') as f:
+                counts = json.load(f)
+            exploited_cves = counts.get('exploitedcves', 0)
+            incompatible_cves = counts.get('incompatiblecves', 0)
+            totcve = int(exploited_cves) + int(incompatible_cves)
+
+            elements.append(Paragraph("Summary Statistics:", styleH))
+            metasploit_summary = (
+                """This table provides a statistical overview of the exploitation module's 
+                performance. The 'Total CVEs Examined' column shows the number of CVEs that were processed by the 
+                exploit module. 'Total Exploited CVEs' represents the number of CVEs that were successfully 
+                exploited, while 'Incompatible CVEs' indicates the number of CVEs for which no corresponding 
+                Metasploit exploit is available."""
+            )
+            elements.append(Paragraph(metasploit_summary, styleN))
+            elements.append(Spacer(1, 0.25 * inch))
+            summary_data = [
+                ["Total CVEs Examined", "Total Exploited CVEs", "Incompatible CVEs"],
+                [
+                    Paragraph(str(totcve), styleN),
+                    Paragraph(str(exploited_cves), styleN),
+                    Paragraph(str(incompatible_cves), styleN),
+                ]
+            ]
+
+            summary_table = Table(
+                summary_data,
+                colWidths=METASPLOIT_SUMMARY_TABLE_COL_WIDTHS
+            )
+
+            summary_table.setStyle(METASPLOIT_SUMMARY_TABLE_STYLE)
+            elements.append(summary_table)
+            elements.append(Spacer(1, 0.5 * inch))
+        else:
+            elements.append(Paragraph("Summary Statistics are not available.", styleN))
+            elements.append(Spacer(1, 0.5 * inch))
+
+    return elements
+
+
 def generate_report(
     csv_path,
     task_name,
@@ -424,36 +1663,29 @@ def generate_report(
     completion_time = time.strftime("%H-%M-%S_%Y-%m-%d")
 
     # Create directories for output files if they don't exist
-    result_graphs_dir = "result_graphs"
-    os.makedirs(result_graphs_dir, exist_ok=True)
+    result_graphs_dir = Path("result_graphs")
+    result_graphs_dir.mkdir(exist_ok=True)
 
-    # Define paths for the output files
+    # Define paths for the output files; matplotlib and reportlab are given them as strings
     rep_csv_path = Path(csv_path)
-    out_path = os.path.join(
-        "custom_reports", f"{task_name}_executive_report_{completion_time}.pdf"
-    )
-    output_pdf_path = out_path
-    pie_out = os.path.join(
-        result_graphs_dir, f"{task_name}_piechart_{completion_time}.png"
-    )
-    pie_chart_path = pie_out
-    exploit_pie_out = os.path.join(
-        result_graphs_dir, f"{task_name}_exploitpiechart_{completion_time}.png"
-    )
-    exploit_pie_chart_path = exploit_pie_out
-    gui_pie_out = os.path.join(
-        result_graphs_dir, f"vuln_pie.png"
-    )
-    gui_pie_out = gui_pie_out
-    gui_exploit_pie_out = os.path.join(
-        result_graphs_dir, f"exploit_pie.png"
-    )
-    gui_exploit_pie_out = gui_exploit_pie_out
+    output_pdf_path = str(Path("custom_reports") / f"{task_name}_executive_report_{completion_time}.pdf")
+    gui_pie_out = str(result_graphs_dir / "vuln_pie.png")
+    gui_exploit_pie_out = str(result_graphs_dir / "exploit_pie.png")
+    historical_graph_out = str(result_graphs_dir / f"{task_name}_historical_counts_{completion_time}.png")
+    heatmap_image_path = str(result_graphs_dir / f"{task_name}_host_metrics_heatmap_{completion_time}.png")
+
+    if not rep_csv_path.exists():
+        logger.error(f"OpenVAS CSV report not found: {rep_csv_path}")
+        print(colored(f"[ERROR] OpenVAS CSV report not found: {rep_csv_path}, skipping report generation", "red"))
+        return
 
     # Load and process CSV data from OpenVAS scan results
-    df = pd.read_csv(rep_csv_path)
-    df = df.astype(str).fillna("Value not found")
-    df["CVSS"] = pd.to_numeric(df["CVSS"], errors="coerce")
+    # Only the columns used in the report are read, and only text columns get a placeholder for missing values
+    df = read_openvas_csv(rep_csv_path, columns=OPENVAS_REPORT_COLUMNS, dtypes=OPENVAS_REPORT_DTYPES)
+    df["Severity"] = df["Severity"].astype(SEVERITY_DTYPE)
+    # Chosen by name, as a text column that is empty in every row is read as float NaN
+    text_columns = df.columns.drop(["CVSS", "QoD", "Severity"])
+    df[text_columns] = df[text_columns].fillna("Value not found")
 
     # Summarise counts
     total_vulns = high_count + medium_count + low_count
@@ -464,15 +1696,22 @@ def generate_report(
     apps_count = apps_count
     os_count = os_count
 
-    # Define paths for historical data and the line graph
-    historical_data_file = "historical_results.json"
-    historical_graph_out = os.path.join(
-        result_graphs_dir, f"{task_name}_historical_counts_{completion_time}.png"
+    # Define the path for historical data
+    historical_data_file = "historical_results.jsonl"
+
+    # Highest-scoring occurrence of each vulnerability, top 10 by CVSS score for reporting;
+    # nlargest selects the 10 rows without sorting every finding, then only those are put in order,
+    # ties in report order
+    top_vulns = df[["NVT Name", "CVSS", "Impact", "Solution"]]
+    top_vulns = (
+        top_vulns[top_vulns["CVSS"].eq(top_vulns.groupby("NVT Name", sort=False)["CVSS"].transform("max"))]
+        .drop_duplicates(subset="NVT Name")
+        .nlargest(10, "CVSS", keep="first")
+        .sort_index()
+        .sort_values(by="CVSS", ascending=False, kind="stable")
+        .pipe(escape_paragraph_columns, ["NVT Name", "Impact", "Solution"])
     )
 
-    # Sort vulnerabilities by CVSS score for reporting
-    top_vulns = df.sort_values(by="CVSS", ascending=False)
-
     # Prepare data for the pie chart (vulnerability severity distribution)
     labels = ["High", "Medium", "Low"]
     colors_list = ["#d43f3a", "#fdc432", "#3eae49"]  # Red, Orange, Green
@@ -490,169 +1729,44 @@ def generate_report(
     #bar_colors = ["#bbeeff", "#3366ff", "#77aaff"]  # Shades of blue
 
     # Load and process Nikto CSV data if provided
-    if nikto_csv_path and os.path.exists(nikto_csv_path):
-        # Read the file content
-        with open(nikto_csv_path, "r") as file:
-            lines = file.readlines()
-
-        # Filter out lines that start with "Nikto" or are empty
-        data_lines = [
-            line
-            for line in lines
-            if not line.startswith('"Nikto') and line.strip() != ""
-            and line.strip() != ""
-            and not line.startswith('Host IP')
-        ]
-
-        # Check if there are any data lines
-        if data_lines:
-            # Create a string from the data_lines
-            data_str = "".join(data_lines)
-
-            # Use io.StringIO to read the data into pandas
-            nikto_df = pd.read_csv(io.StringIO(data_str), header=None)
-            nikto_df.columns = [
-                "Host",
-                "IP",
-                "Port",
-                "Reference",
-                "Method",
-                "URI",
-                "Description",
-                "MID",
-                "DID",
-            ]
-            nikto_df.fillna("N/A", inplace=True)
-        else:
-            nikto_df = None
+    if nikto_csv_path and Path(nikto_csv_path).is_file():
+        nikto_df = read_nikto_csv(nikto_csv_path)
     else:
         nikto_df = None
 
-    try:
-        # Generate the pie chart for vulnerabilities
-        fig1, ax1 = plt.subplots(figsize=(3.5, 3.5))
-        wedges, texts = ax1.pie(
-            sizes,
-            labels=labels,
-            colors=colors_list,
-            startangle=90,
-            wedgeprops=dict(width=0.6, edgecolor="white"),
-            textprops=dict(color="black", fontsize=10),
+    # The pie charts are independent of each other and of the rest of the report,
+    # so they are drawn and saved on worker threads while the report is assembled.
+    # A pie of all-zero counts cannot be drawn, so those charts are not rendered at all.
+    # The report pies are only embedded in the PDF, so they are kept in memory instead of written to disk
+    pie_chart_image = io.BytesIO()
+    exploit_pie_chart_image = io.BytesIO()
+    chart_executor = ThreadPoolExecutor(max_workers=4)
+    chart_futures = {}
+    if any(sizes):
+        chart_futures["pie graph"] = chart_executor.submit(
+            save_donut_chart, pie_chart_image, sizes, labels, colors_list, "Vulnerabilities", "Severity"
         )
-
-        # Add a center circle to make it a donut chart
-        center_circle = plt.Circle((0, 0), 0.60, fc="white")
-        fig1.gca().add_artist(center_circle)
-
-        # Set the title and legend
-        ax1.set_title("Vulnerabilities", fontsize=12, fontweight="bold", pad=15)
-        ax1.legend(
-            wedges,
-            labels,
-            title="Severity",
-            loc="center left",
-            bbox_to_anchor=(1, 0, 0.5, 1),
-            fontsize=10,
+        chart_futures["GUI vuln pie chart"] = chart_executor.submit(
+            save_gui_pie_chart,
+            gui_pie_out,
+            [high_vulns, medium_vulns, low_vulns],
+            ['High', 'Medium', 'Low'],
+            ['#ff6f61', '#ffcc66', '#66cc66'],
         )
-
-        plt.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle
-
-        # Save the pie chart image
-        plt.savefig(pie_chart_path, bbox_inches="tight", dpi=300)
-        plt.close(fig1)  # Close the figure to free memory
-    except Exception as e:
-        print(colored(f"[ERROR] Failed to generate pie graph: {e}", "red"))
-
-    # Generate the pie chart for exploits
-    try:
-        fig1, ax1 = plt.subplots(figsize=(3.5, 3.5))
-        wedges, texts = ax1.pie(
+    if any(exploit_sizes):
+        chart_futures["exploits pie chart"] = chart_executor.submit(
+            save_donut_chart,
+            exploit_pie_chart_image,
             exploit_sizes,
-            labels=exploit_labels,
-            colors=exploit_color_list,
-            startangle=90,
-            wedgeprops=dict(width=0.6, edgecolor="white"),
-            textprops=dict(color="black", fontsize=10),
-        )
-
-        # Add a center circle to make it a donut chart
-        center_circle = plt.Circle((0, 0), 0.60, fc="white")
-        fig1.gca().add_artist(center_circle)
-
-        # Set the title and legend
-        ax1.set_title("Exploits", fontsize=12, fontweight="bold", pad=15)
-        ax1.legend(
-            wedges,
             exploit_labels,
-            title="Exploit Status",
-            loc="center left",
-            bbox_to_anchor=(1, 0, 0.5, 1),
-            fontsize=10,
+            exploit_color_list,
+            "Exploits",
+            "Exploit Status",
         )
-
-        plt.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle
-
-        # Save the pie chart image
-        plt.savefig(exploit_pie_out, bbox_inches="tight", dpi=300)
-        plt.close(fig1)  # Close the figure to free memory
-    except Exception as e:
-        print(colored(f"[ERROR] Failed to generate exploits pie chart: {e}", "red"))
-
-    try:
-        gui_vuln_labels = ['High', 'Medium', 'Low']
-        gui_vuln_sizes = [high_vulns, medium_vulns, low_vulns]
-        gui_vuln_colors = ['#ff6f61', '#ffcc66', '#66cc66']
-        explode = (0, 0, 0)  # No slice explode
-
-        # Adjust the figure size to provide more room for the legend
-        fig_vuln_gui, ax = plt.subplots(figsize=(3.12, 1.96))
-
-        # Create the pie chart
-        ax.pie(gui_vuln_sizes, labels=None, colors=gui_vuln_colors, autopct=lambda p: f'{round(p * sum(gui_vuln_sizes) / 100)}',
-               startangle=90, explode=explode, textprops={'fontsize': 8})
-
-        fig_vuln_gui.patch.set_alpha(0)  # Makes the background transparent
-
-        # Create custom legend with circle markers and no lines
-        legend_elements = [Line2D([0], [0], marker='o', color='w', label=label, markersize=7,
-                                  markerfacecolor=color, linestyle='None')
-                           for label, color in zip(gui_vuln_labels, gui_vuln_colors)]
-
-        # Place the legend closer to the pie chart
-        legend = ax.legend(handles=legend_elements, loc='center left', bbox_to_anchor=(0.85, 0.5), frameon=False,
-                           fontsize=8)
-
-        for text in legend.get_texts():
-            text.set_color("white")
-
-        plt.savefig(gui_pie_out, bbox_inches="tight")
-        plt.close(fig_vuln_gui)  # Close the figure to free memory
-    except Exception as e:
-        print(colored(f"[ERROR] Failed to generate GUI vuln pie chart: {e}", "red"))
-
-    # Generate the pie graph for the GUI result section (exploits)
-    try:
-        explode = (0, 0)  # No slice explode
-        # Adjust the figure size to provide more room for the legend
-        fig_exp_gui, ax = plt.subplots(figsize=(3.12, 1.96))
-        # Create the pie chart
-        ax.pie(exploit_sizes, labels=None, colors=exploit_color_list,
-               autopct=lambda p: f'{round(p * sum(exploit_sizes) / 100)}',
-               startangle=90, explode=explode, textprops={'fontsize': 8})
-        fig_exp_gui.patch.set_alpha(0)  # Makes the background transparent
-        # Create custom legend with circle markers and no lines
-        legend_elements = [Line2D([0], [0], marker='o', color='w', label=label, markersize=7,
-                                  markerfacecolor=color, linestyle='None')
-                           for label, color in zip(exploit_labels, exploit_color_list)]
-        # Place the legend closer to the pie chart
-        legend = ax.legend(handles=legend_elements, loc='center left', bbox_to_anchor=(0.85, 0.5), frameon=False,
-                           fontsize=8)
-        for text in legend.get_texts():
-            text.set_color("white")
-        plt.savefig(gui_exploit_pie_out, bbox_inches="tight")
-        plt.close(fig_exp_gui)  # Close the figure to free memory
-    except Exception as e:
-        print(colored(f"[ERROR] Failed to generate GUI exploit pie chart: {e}", "red"))
+        chart_futures["GUI exploit pie chart"] = chart_executor.submit(
+            save_gui_pie_chart, gui_exploit_pie_out, exploit_sizes, exploit_labels, exploit_color_list
+        )
+    chart_executor.shutdown(wait=False)
 
     # -------------------- #
     # Historical Data      #
@@ -672,20 +1786,12 @@ def generate_report(
             high_count=high_vulns,
             medium_count=medium_vulns,
             low_count=low_vulns,
-            timestamp=current_timestamp
+            timestamp=current_timestamp,
+            file_path=historical_data_file,  # Only the new record is written to the file
         )
 
-        # Save the updated historical data
-        save_historical_data(historical_data_file, historical_data)
-
-        # Generate the historical line graph
-        generate_line_graph(historical_data, historical_graph_out)
-
-        # Check if the graph was generated successfully
-        if os.path.exists(historical_graph_out):
-            graph_generated = True
-        else:
-            graph_generated = False
+        # Generate the historical line graph; it reports whether the graph was saved, so the file is not checked again
+        graph_generated = generate_line_graph(historical_data, historical_graph_out)
     except Exception as e:
         logger.error(f"Failed to process historical data: {e}")
         graph_generated = False
@@ -703,156 +1809,63 @@ def generate_report(
             leftMargin=50,
             topMargin=50,
             bottomMargin=50,
+            pageCompression=1,  # Always deflate page streams, regardless of the global rl_config default
         )
 
         elements = []  # List to hold the flowable elements of the PDF
 
         # Styles for the PDF
-        styles = getSampleStyleSheet()
-        styleN = styles["BodyText"]
-        styleH = styles["Heading1"]
-        styleTitle = styles["Title"]
-        styleH.fontSize = 15
-        styleH.leading = 17
-
-        # Centered paragraph style
-        centered_style = ParagraphStyle(
-            name="Centered",
-            alignment=1,  # Center the text
-            fontSize=10,
-            leading=14,  # Line height
-            fontName="Helvetica",
-        )
+        styleN = BODY_STYLE
+        styleH = HEADING_STYLE
+        styleTitle = TITLE_STYLE
+        centered_style = CENTERED_STYLE
 
         # -------------------- #
         #     Title Page       #
         # -------------------- #
 
         # --- Build the Title Page ---
-        elements.append(Spacer(1, 0.5 * inch))
-        elements.append(
-            Paragraph("Vulnerability Scanning and Exploitation Report", styleTitle)
-        )
-        elements.append(Spacer(1, 0.1 * inch))
-        elements.append(Paragraph(f"Automated Security Assessment", centered_style))
-        elements.append(Paragraph(f"Created by: MedusaGuard v1.0", centered_style))
-        elements.append(
-            Paragraph(f"Date: {datetime.now().strftime('%d-%m-%Y')}", centered_style)
-        )
-
-        # Confidentiality note in italicized font
-        confidentiality_style = ParagraphStyle(
-            name="Confidentiality",
-            fontSize=9,
-            textColor=colors.HexColor("#666666"),
-            fontName="Helvetica-Oblique",
-            leading=12,
-        )
-
-        # Report summary style
-        rep_summary_style = ParagraphStyle(
-            name="Centered",
-            fontSize=10,
-            leading=14,  # Line height
-            fontName="Helvetica",
-        )
-
-        elements.append(Spacer(1, 0.3 * inch))
-        elements.append(
-            Paragraph(
-                "This document contains the results of the automated vulnerability scanning and exploitation tool known as MedusaGuard. "
-                "It outlines identified vulnerabilities, their potential impacts, and suggested remediation strategies "
-                "along with whether or not they are exploitable.",
-                rep_summary_style,
-            )
-        )
-        elements.append(Spacer(1, 0.3 * inch))
-        elements.append(
-            Paragraph(
-                "This document is confidential and intended solely for the use of the client. "
-                "Unauthorized access, disclosure, or distribution is strictly prohibited.",
-                confidentiality_style,
-            )
+        elements.extend(
+            [
+                Spacer(1, 0.5 * inch),
+                Paragraph("Vulnerability Scanning and Exploitation Report", styleTitle),
+                Spacer(1, 0.1 * inch),
+                Paragraph(f"Automated Security Assessment", centered_style),
+                Paragraph(f"Created by: MedusaGuard v1.0", centered_style),
+                Paragraph(f"Date: {datetime.now().strftime('%d-%m-%Y')}", centered_style),
+                Spacer(1, 0.3 * inch),
+                Paragraph(
+                    "This document contains the results of the automated vulnerability scanning and exploitation tool known as MedusaGuard. "
+                    "It outlines identified vulnerabilities, their potential impacts, and suggested remediation strategies "
+                    "along with whether or not they are exploitable.",
+                    REP_SUMMARY_STYLE,
+                ),
+                Spacer(1, 0.3 * inch),
+                Paragraph(
+                    "This document is confidential and intended solely for the use of the client. "
+                    "Unauthorized access, disclosure, or distribution is strictly prohibited.",
+                    CONFIDENTIALITY_STYLE,
+                ),
+                Spacer(1, 0.5 * inch),
+            ]
         )
 
-        elements.append(Spacer(1, 0.5 * inch))
-
         # -------------------- #
         #   Table of Contents   #
         # -------------------- #
 
         # --- Table of Contents ---
-        toc_title_style = ParagraphStyle(
-            name="TOCTitle",
-            fontSize=10,
-            fontName="Helvetica-Bold",
-            alignment=1,  # Centered text
-            spaceAfter=12,  # Space after the title
-        )
+        toc_table = Table(TOC_DATA, colWidths=TOC_COL_WIDTHS)
+        toc_table.setStyle(TOC_TABLE_STYLE)
 
-        # Manually created Table of Contents data
-        toc_data = [
-            [
-                "Executive Summary ................................................................................................................................................................................",
-                "2",
-            ],
-            [
-                "Key Findings ...........................................................................................................................................................................................",
-                "2",
-            ],
-            [
-                "Top 10 Vulnerabilities .............................................................................................................................................................................",
-                "3",
-            ],
-            [
-                "Recommendations ..................................................................................................................................................................................",
-                "4",
-            ],
+        elements.extend(
             [
-                "Conclusion ..............................................................................................................................................................................................",
-                "4",
-            ],
-            [
-                "Appendix 1: Definitions ...........................................................................................................................................................................",
-                "4",
-            ],
-            [
-                "Appendix 2: Recommended Actions to be Taken Based on Vulnerability Severity ................................................................................",
-                "5",
-            ],
-            [
-                "Appendix 3: Host-Level Vulnerability Metrics ..........................................................................................................................................",
-                "6",
-            ],
-            [
-                "Appendix 4: Detailed Tool Results  .........................................................................................................................................................",
-                "7",
-            ],
-        ]
-
-        # Create the Table of Contents table
-        toc_table = Table(toc_data, colWidths=[5.7 * inch, 1 * inch])
-        toc_table.setStyle(
-            TableStyle(
-                [
-                    (
-                        "ALIGN",
-                        (0, 0),
-                        (0, -1),
-                        "LEFT",
-                    ),  # Left-align the first column (section titles)
-                    ("ALIGN", (1, 0), (1, -1), "RIGHT"),  # Right-align the page numbers
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 8),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
-                ]
-            )
+                Paragraph("Table of Contents", TOC_TITLE_STYLE),
+                toc_table,
+                PageBreak(),  # Start a new page
+            ]
         )
 
-        elements.append(Paragraph("Table of Contents", toc_title_style))
-        elements.append(toc_table)
-        elements.append(PageBreak())  # Start a new page
-
         # -------------------- #
         #   Executive Summary  #
         # -------------------- #
@@ -860,42 +1873,25 @@ def generate_report(
         # --- Executive Summary ---
         elements.append(Paragraph("1. Executive Summary", styleH))
 
-        summary_availabe = all([
-            hosts_scanned is not None,
-            total_vulns is not None,
-            high_vulns is not None,
-            medium_vulns is not None,
-            low_vulns is not None
-        ])
+        summary_available = (
+            hosts_scanned is not None
+            and total_vulns is not None
+            and high_vulns is not None
+            and medium_vulns is not None
+            and low_vulns is not None
+        )
 
-        if summary_availabe:
+        if summary_available:
             # Generate the executive summary based on the number of high vulnerabilities
             if high_vulns >= 5:
-                exec_summary = (
-                    f"The purpose of this security assessment was to identify weaknesses within our IT infrastructure "
-                    f"that could be exploited by attackers, potentially leading to financial loss, regulatory penalties, "
-                    f"or damage to our reputation. Of the {hosts_scanned} hosts scanned, {total_vulns} vulnerabilities were found, "
-                    f"with {high_vulns} categorized as high, posing the most significant risk. "
-                    f"Immediate remediation of any high vulnerabilities "
-                    f"identified is necessary to avoid potential business disruptions and ensure the continued trust of our customers. "
-                    f"This report provides detailed findings and actionable recommendations to mitigate these risks, safeguarding your operations."
-                )
+                exec_summary_text = EXEC_SUMMARY_HIGH_RISK_TEXT
             elif 1 <= high_vulns < 5:
-                exec_summary = (
-                    f"The security assessment identified several areas of concern within the IT infrastructure. "
-                    f"Out of {hosts_scanned} hosts scanned, {total_vulns} vulnerabilities were found, "
-                    f"with {high_vulns} categorized as high severity. "
-                    f"Timely remediation of identified vulnerabilities is recommended to enhance the security posture. "
-                    f"This report provides detailed findings and actionable recommendations to address these risks."
-                )
+                exec_summary_text = EXEC_SUMMARY_MODERATE_RISK_TEXT
             else:
-                exec_summary = (
-                    f"The security assessment indicates a relatively low level of risk within the IT infrastructure. "
-                    f"Out of {hosts_scanned} hosts scanned, {total_vulns} vulnerabilities were identified, "
-                    f"with {high_vulns} categorized as high severity. "
-                    f"While immediate risk is low, addressing identified vulnerabilities will help maintain and improve your security posture. "
-                    f"This report provides detailed findings and recommendations for ongoing security enhancements."
-                )
+                exec_summary_text = EXEC_SUMMARY_LOW_RISK_TEXT
+            exec_summary = exec_summary_text.format(
+                hosts_scanned=hosts_scanned, total_vulns=total_vulns, high_vulns=high_vulns
+            )
 
             elements.append(Paragraph(exec_summary, styleN))
         else:
@@ -916,159 +1912,56 @@ def generate_report(
         # --- Key Findings ---
         elements.append(Paragraph("2. Key Findings", styleH))
 
-        if any([high_vulns, medium_vulns, low_vulns]):
-            # Styles for the vulnerability counts
-            count_style = ParagraphStyle(
-                name="count",
-                alignment=1,  # Centered text
-                fontSize=18,
-                textColor=colors.whitesmoke,
-                spaceAfter=6,
-                fontName="Helvetica",
-            )
-
-            label_style = ParagraphStyle(
-                name="label",
-                alignment=1,  # Centered text
-                fontSize=8,
-                textColor=colors.whitesmoke,
-                spaceBefore=0,
-                fontName="Helvetica-Bold",
-            )
+        # Wait for every chart, including the GUI pies, before the report pies are embedded,
+        # so no failure goes unreported and no chart is still being written when the report is done
+        for chart_name, chart_future in chart_futures.items():
+            try:
+                chart_future.result()
+            except Exception as e:
+                logger.error(f"Failed to generate {chart_name}: {e}")
+                print(colored(f"[ERROR] Failed to generate {chart_name}: {e}", "red"))
 
+        if high_vulns or medium_vulns or low_vulns:
             # Data for the counts table
+            # The cells never wrap, so they are plain strings styled by the table rather than Paragraphs
             data = [
-                [
-                    Paragraph(str(high_vulns), count_style),
-                    Paragraph(str(medium_vulns), count_style),
-                    Paragraph(str(low_vulns), count_style),
-                ],
-                [
-                    Paragraph("HIGH", label_style),
-                    Paragraph("MEDIUM", label_style),
-                    Paragraph("LOW", label_style),
-                ],
+                [str(high_vulns), str(medium_vulns), str(low_vulns)],
+                ["HIGH", "MEDIUM", "LOW"],
             ]
 
             # Create the counts table
             table = Table(
                 data,
-                colWidths=[2.25 * inch, 2.25 * inch, 2.25 * inch],
-                rowHeights=[0.75 * inch, 0.3 * inch],
-            )
-            table.setStyle(
-                TableStyle(
-                    [
-                        (
-                            "BACKGROUND",
-                            (0, 0),
-                            (0, 0),
-                            colors.HexColor("#E74C3C"),
-                        ),  # Red background for High
-                        (
-                            "BACKGROUND",
-                            (1, 0),
-                            (1, 0),
-                            colors.HexColor("#F39C12"),
-                        ),  # Orange background for Medium
-                        (
-                            "BACKGROUND",
-                            (2, 0),
-                            (2, 0),
-                            colors.HexColor("#2ECC71"),
-                        ),  # Green background for Low
-                        (
-                            "TEXTCOLOR",
-                            (0, 0),
-                            (-1, 0),
-                            colors.whitesmoke,
-                        ),  # White text color for counts
-                        (
-                            "TEXTCOLOR",
-                            (0, 1),
-                            (-1, 1),
-                            colors.whitesmoke,
-                        ),  # White text color for labels
-                        (
-                            "ALIGN",
-                            (0, 0),
-                            (-1, -1),
-                            "CENTER",
-                        ),  # Center-align text in all cells
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),  # Middle vertical alignment
-                        (
-                            "FONTNAME",
-                            (0, 0),
-                            (-1, 0),
-                            "Helvetica",
-                        ),  # Regular font for counts
-                        (
-                            "BACKGROUND",
-                            (0, 1),
-                            (0, 1),
-                            colors.HexColor("#2C3E50"),
-                        ),  # Dark background for labels
-                        (
-                            "BACKGROUND",
-                            (1, 1),
-                            (1, 1),
-                            colors.HexColor("#2C3E50"),
-                        ),  # Dark background for labels
-                        (
-                            "BACKGROUND",
-                            (2, 1),
-                            (2, 1),
-                            colors.HexColor("#2C3E50"),
-                        ),  # Dark background for labels
-                        (
-                            "BOX",
-                            (0, 0),
-                            (-1, -1),
-                            0.75,
-                            colors.whitesmoke,
-                        ),  # Thicker border around the table
-                    ]
-                )
+                colWidths=VULN_COUNTS_TABLE_COL_WIDTHS,
+                rowHeights=VULN_COUNTS_TABLE_ROW_HEIGHTS,
             )
+            table.setStyle(VULN_COUNTS_TABLE_STYLE)
 
             # Add the heading
-            heading = Paragraph(
-                "Vulnerability count:",
-                ParagraphStyle(
-                    name="Heading1",
-                    fontSize=10,
-                    alignment=0,  # Aligned-left
-                    textColor=colors.black,
-                    spaceAfter=12,  # Space after the heading
-                    fontName="Helvetica",
-                ),
-            )
+            heading = Paragraph("Vulnerability count:", VULN_COUNT_HEADING_STYLE)
 
-            elements.append(heading)
-            elements.append(table)
-            elements.append(Spacer(1, 0.25 * inch))
+            elements.extend(
+                [
+                    heading,
+                    table,
+                    Spacer(1, 0.25 * inch),
+                ]
+            )
 
-            if os.path.exists(pie_chart_path) and os.path.exists(exploit_pie_chart_path):
+            if pie_chart_image.getbuffer().nbytes and exploit_pie_chart_image.getbuffer().nbytes:
+                pie_chart_image.seek(0)
+                exploit_pie_chart_image.seek(0)
                 # Add the pie chart and bar chart side by side
                 chart_table = Table(
                     [
                         [
-                            Image(pie_chart_path, width=2.50 * inch, height=2 * inch),
-                            Image(exploit_pie_chart_path, width=2.50 * inch, height=2 * inch),
+                            Image(pie_chart_image, width=2.50 * inch, height=2 * inch),
+                            Image(exploit_pie_chart_image, width=2.50 * inch, height=2 * inch),
                         ]
                     ],
-                    colWidths=[2.875 * inch, 2.875 * inch],
-                )
-                chart_table.setStyle(
-                    TableStyle(
-                        [
-                            ("LEFTPADDING", (0, 0), (-1, -1), 12),
-                            ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-                            ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
-                            ("TOPPADDING", (0, 0), (-1, -1), 12),
-                        ]
-                    )
+                    colWidths=CHART_TABLE_COL_WIDTHS,
                 )
+                chart_table.setStyle(CHART_TABLE_STYLE)
                 elements.append(chart_table)
                 elements.append(Spacer(1, 0.5 * inch))
 
@@ -1081,18 +1974,9 @@ def generate_report(
                                 Image(historical_graph_out, width=6.75 * inch, height=3.375 * inch)
                             ]
                         ],
-                        colWidths=[6.75 * inch]
-                    )
-                    historical_graph_table.setStyle(
-                        TableStyle(
-                            [
-                                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-                                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                            ]
-                        )
+                        colWidths=HISTORICAL_GRAPH_TABLE_COL_WIDTHS
                     )
+                    historical_graph_table.setStyle(HISTORICAL_GRAPH_TABLE_STYLE)
                     elements.append(historical_graph_table)
                     elements.append(Spacer(1, 0.5 * inch))
             else:
@@ -1115,115 +1999,36 @@ def generate_report(
 
         # --- Top 10 Vulnerabilities ---
         elements.append(Paragraph("3. Top 10 Vulnerabilities", styleH))
-        top_10_text = (
-            "The following table details the top 10 most critical vulnerabilities identified in the scan. It is ordered from "
-            "most significant risk to least significant risk, with a CVSS score of 10.0 being the highest score possible "
-            "awarded to vulnerabilities that pose a major risk. Please refer to the definitions table in the appendix "
-            "if any of the terms are unknown to you."
-        )
-        elements.append(Paragraph(top_10_text, styleN))
-
-        # Prepare data for the vulnerabilities table
-        vuln_data = [["Vulnerability", "CVSS", "Impact", "Remediation"]]
-        # Set to track unique vulnerabilities
-        unique_vulns = set()
-
-        # Iterate over the sorted vulnerabilities to get the top 10 unique entries
-        for i, (_, row) in enumerate(top_vulns.iterrows()):
-            vuln_name = row["NVT Name"]
-
-            # Check if the vulnerability is already in the set
-            if vuln_name not in unique_vulns:
-                # Add it to the set if it's not already present
-                unique_vulns.add(vuln_name)
+        elements.append(Paragraph(TOP_10_TEXT, styleN))
 
-                # Append the row to the table data
-                vuln_data.append(
-                    [
-                        Paragraph(
-                            str(vuln_name), styleN
-                        ),  # Wrap text in the 'Vulnerability' column
-                        Paragraph(str(row["CVSS"]), styleN),  # CVSS score as a string
-                        Paragraph(
-                            str(row["Impact"]), styleN
-                        ),  # Convert to string and wrap text in the 'Impact' column
-                        Paragraph(
-                            str(row["Solution"]), styleN
-                        ),  # Convert to string and wrap text in the 'Remediation' column
-                    ]
-                )
-
-                if len(vuln_data) > 10:
-                    break  # Stop after adding 10 vulnerabilities
-
-        # Conditional check: if there are vulnerabilities beyond the header, add the table; else, add a message
-        if len(vuln_data) > 1:
-            # Create the vulnerabilities table
-            vuln_table = Table(
-                vuln_data, colWidths=[1.3 * inch, 0.5 * inch, 2.6 * inch, 2.3 * inch]
+        # Skip building the table rows when no vulnerabilities were found
+        if top_vulns.empty:
+            # No vulnerabilities found
+            no_vuln_message = Paragraph(
+                "No vulnerabilities were found during the scan.", styleN
             )
-            vuln_table_style = TableStyle(
+            elements.append(no_vuln_message)
+        else:
+            # Prepare data for the vulnerabilities table
+            # The top 10 unique vulnerabilities are already selected and sorted; text is wrapped in Paragraphs
+            vuln_data = [["Vulnerability", "CVSS", "Impact", "Remediation"]] + [
                 [
-                    (
-                        "BACKGROUND",
-                        (0, 0),
-                        (-1, 0),
-                        colors.HexColor("#2C3E50"),
-                    ),  # Blue background for the header row
-                    (
-                        "TEXTCOLOR",
-                        (0, 0),
-                        (-1, 0),
-                        colors.whitesmoke,
-                    ),  # White text color for the header row
-                    (
-                        "ALIGN",
-                        (0, 0),
-                        (-1, -1),
-                        "LEFT",
-                    ),  # Left-align text for better readability
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),  # Reduced font size for better fit
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                    ("TOPPADDING", (0, 0), (-1, 0), 10),
-                    ("BOTTOMPADDING", (1, 0), (-1, -1), 8),
-                    ("TOPPADDING", (1, 0), (-1, -1), 8),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),  # Black grid lines
-                    (
-                        "BOX",
-                        (0, 0),
-                        (-1, -1),
-                        0.75,
-                        colors.black,
-                    ),  # Thicker border around the table
-                    (
-                        "VALIGN",
-                        (0, 0),
-                        (-1, -1),
-                        "TOP",
-                    ),  # Align text to the top of each cell
+                    Paragraph(str(vuln_name), styleN),
+                    str(cvss),  # Short numeric cell, drawn as a plain string in the table font
+                    Paragraph(str(impact), styleN),
+                    Paragraph(str(solution), styleN),
                 ]
-            )
+                for vuln_name, cvss, impact, solution in top_vulns.itertuples(index=False, name=None)
+            ]
 
-            # Manually alternate row background colors
-            for i in range(1, len(vuln_data)):
-                if i % 2 == 0:
-                    bg_color = colors.HexColor("#EAECEE")  # Light gray
-                else:
-                    bg_color = colors.HexColor("#F2F3F4")
-                vuln_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
+            # Create the vulnerabilities table
+            vuln_table = Table(
+                vuln_data, colWidths=TOP_VULNS_TABLE_COL_WIDTHS
+            )
 
-            vuln_table.setStyle(vuln_table_style)
+            vuln_table.setStyle(TOP_VULNS_TABLE_STYLE)
             elements.append(Spacer(1, 0.25 * inch))
             elements.append(vuln_table)
-        else:
-            # No vulnerabilities found
-            no_vuln_message = Paragraph(
-                "No vulnerabilities were found during the scan.", styleN
-            )
-            elements.append(no_vuln_message)
 
         elements.append(Spacer(1, 0.75 * inch))
 
@@ -1232,19 +2037,13 @@ def generate_report(
         # -------------------- #
 
         # --- Recommendations ---
-        elements.append(Paragraph("4. Recommendations", styleH))
-        recommendations = (
-            "Immediately address any critical vulnerabilities, continue to perform regular security assessments, "
-            "and allocate resources to strengthen the security posture of our organization. "
-            "We strongly recommend establishing a continuous vulnerability management program, including regular security "
-            "assessments and timely remediation of any identified high-risk vulnerabilities. By proactively managing vulnerabilities, "
-            "the organisation can significantly reduce risk and ensure compliance with industry regulations and best practices. "
-            "In addition, it is highly advisable to leverage robust security tools to verify these findings and validate remediation efforts. "
-            "Tools like Tenable Nessus, Qualys, and Rapid7 InsightVM are industry-standard vulnerability scanners that can provide a secondary layer of assurance. "
-            "Furthermore, manual exploitation of CVEs that were identified is recommended."
+        elements.extend(
+            [
+                Paragraph("4. Recommendations", styleH),
+                Paragraph(RECOMMENDATIONS_TEXT, styleN),
+                Spacer(1, 0.75 * inch),
+            ]
         )
-        elements.append(Paragraph(recommendations, styleN))
-        elements.append(Spacer(1, 0.75 * inch))
 
         # -------------------- #
         #      Conclusion      #
@@ -1252,16 +2051,20 @@ def generate_report(
 
         # --- Conclusion ---
         elements.append(Paragraph("5. Conclusion", styleH))
-        conclusion = (
-                f"In conclusion, the assessment identified a total of {total_vulns} vulnerabilities "
-                f"across {hosts_scanned} hosts, with {high_vulns} high-risk, {medium_vulns} medium-risk, and "
-                f"{low_vulns} low-risk vulnerabilities. The presence of high-risk vulnerabilities indicates a significant "
-                "threat to the organisation. Immediate action is required to remediate high-risk vulnerabilities to prevent "
-                "potential breaches that could lead to financial, reputational, or regulatory damages."
+        conclusion = CONCLUSION_TEXT.format(
+            total_vulns=total_vulns,
+            hosts_scanned=hosts_scanned,
+            high_vulns=high_vulns,
+            medium_vulns=medium_vulns,
+            low_vulns=low_vulns,
+        )
+        elements.extend(
+            [
+                Paragraph(conclusion, styleN),
+                Spacer(1, 0.75 * inch),
+                PageBreak(),
+            ]
         )
-        elements.append(Paragraph(conclusion, styleN))
-        elements.append(Spacer(1, 0.75 * inch))
-        elements.append(PageBreak())
 
         # -------------------- #
         #      Appendices      #
@@ -1275,219 +2078,53 @@ def generate_report(
 
         # Appendix: Definitions
         elements.append(Paragraph("Appendix 1: Definitions", styleH))
-        definitions_data = [
-            ["Term", "Definition"],
-            [
-                Paragraph("CVE (Common Vulnerabilities and Exposure)", styleN),
-                Paragraph(
-                    "A list of publicly disclosed computer security flaws, each identified by a unique number called a CVE ID.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("Severity", styleN),
-                Paragraph(
-                    "The level of impact that a vulnerability could have on the organisation, categorised as High, Medium, or Low with high being the most critical, etc.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("Exploit", styleN),
-                Paragraph(
-                    "A piece of code or technique that takes advantage of a vulnerability to compromise a system.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("Vulnerability", styleN),
-                Paragraph(
-                    "A weakness in a system that can be exploited by an attacker to perform malicious actions.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("Vulnerability Scan", styleN),
-                Paragraph(
-                    "Automated process that identifies, evaluates, and reports potential security weaknesses in an organisation’s IT systems.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("DID (Detection ID)", styleN),
-                Paragraph(
-                    "Detection ID (DID) is a unique identifier assigned to each individual occurrence of a vulnerability on a specific asset.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("Quality of Detection (QoD)", styleN),
-                Paragraph(
-                    "A metric used in OpenVAS scanning to represent the confidence level or reliability of a detected vulnerability. QoD values are expressed as percentages, with higher percentages indicating greater confidence in the accuracy of the detection.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("Asset Criticality Score (ACS)", styleN),
-                Paragraph(
-                    "A numerical value from 1 to 5 assigned to an asset to indicate its importance or criticality to the organisation. Higher scores denote higher criticality, which may warrant prioritising remediation efforts. For example, an asset with a criticality score of 5 is a highly critical asset and should be prioritised accordingly. The default ACS is 1. ",
-                    styleN,
-                ),
-            ],
+        definitions_data = [["Term", "Definition"]] + [
+            [Paragraph(term, styleN), Paragraph(definition, styleN)]
+            for term, definition in DEFINITIONS
         ]
 
-        definitions_table = Table(definitions_data, colWidths=[2.3 * inch, 4.4 * inch])
-        definitions_table_style = TableStyle(
+        definitions_table = Table(definitions_data, colWidths=DEFINITIONS_TABLE_COL_WIDTHS)
+        definitions_table.setStyle(APPENDIX_TABLE_STYLE)
+        elements.extend(
             [
-                (
-                    "BACKGROUND",
-                    (0, 0),
-                    (-1, 0),
-                    colors.HexColor("#2C3E50"),
-                ),  # Blue background for the header row
-                (
-                    "TEXTCOLOR",
-                    (0, 0),
-                    (-1, 0),
-                    colors.whitesmoke,
-                ),  # White text color for the header row
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),  # Left-align text
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                ("TOPPADDING", (0, 0), (-1, 0), 10),
-                ("BOTTOMPADDING", (1, 0), (-1, -1), 8),
-                ("TOPPADDING", (1, 0), (-1, -1), 8),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),  # Black grid lines
-                (
-                    "BOX",
-                    (0, 0),
-                    (-1, -1),
-                    0.75,
-                    colors.black,
-                ),  # Thicker border around the table
+                definitions_table,
+                Spacer(1, 0.75 * inch),
+                PageBreak(),
             ]
         )
 
-        # Manually alternate row background colors for definitions table
-        for i in range(1, len(definitions_data)):
-            if i % 2 == 0:
-                bg_color = colors.HexColor("#EAECEE")  # Light gray
-            else:
-                bg_color = colors.HexColor("#F2F3F4")
-            definitions_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-        definitions_table.setStyle(definitions_table_style)
-        elements.append(definitions_table)
-        elements.append(Spacer(1, 0.75 * inch))
-        elements.append(PageBreak())
-
         # -------------------- #
         # Appendix 2: Recommended Actions #
         # -------------------- #
 
         # Appendix: Recommended Actions
-        elements.append(
-            Paragraph(
-                "Appendix 2: Recommended Actions to be Taken Based on Vulnerability Severity",
-                styleH,
-            )
-        )
-        reccomended_actions_text = (
-            "The following table outlines the recommended actions that should be taken based on vulnerability severity. "
-            "It serves as a point of reference when analysing the report so when, for example, you discover a high vulnerability "
-            "you can refer to this table to determine what actions should be taken."
-        )
-        elements.append(Paragraph(reccomended_actions_text, styleN))
-        elements.append(Spacer(1, 0.25 * inch))
-        actions_data = [
-            ["Severity", "Description", "Recommended Actions"],
-            [
-                Paragraph("High", styleN),
-                Paragraph(
-                    "Vulnerabilities that pose an immediate threat to the organisation and could lead to significant business impact if exploited.",
-                    styleN,
-                ),
-                Paragraph(
-                    "1. Immediate remediation within 24 hours.<br/>2. Apply security patches or mitigations.<br/>3. Increase monitoring on affected systems.<br/>4. Notify relevant stakeholders.",
-                    styleN,
-                ),
-            ],
-            [
-                Paragraph("Medium", styleN),
-                Paragraph(
-                    "Vulnerabilities that have a moderate impact and could lead to significant issues if left unaddressed.",
-                    styleN,
-                ),
-                Paragraph(
-                    "1. Remediate within 7 days.<br/>2. Apply available patches or mitigations.<br/>3. Monitor for signs of exploitation.",
-                    styleN,
-                ),
-            ],
+        elements.extend(
             [
-                Paragraph("Low", styleN),
-                Paragraph(
-                    "Vulnerabilities that have a minor impact and are less likely to be exploited but should still be addressed.",
-                    styleN,
-                ),
                 Paragraph(
-                    "1. Remediate within 30 days.<br/>2. Apply patches as part of regular maintenance.<br/>3. Monitor the situation to ensure no escalation.",
-                    styleN,
+                    "Appendix 2: Recommended Actions to be Taken Based on Vulnerability Severity",
+                    styleH,
                 ),
-            ],
+                Paragraph(RECOMMENDED_ACTIONS_TEXT, styleN),
+                Spacer(1, 0.25 * inch),
+            ]
+        )
+        actions_data = [["Severity", "Description", "Recommended Actions"]] + [
+            [Paragraph(severity, styleN), Paragraph(description, styleN), Paragraph(actions, styleN)]
+            for severity, description, actions in RECOMMENDED_ACTIONS
         ]
 
         actions_table = Table(
-            actions_data, colWidths=[1.2 * inch, 2.5 * inch, 3 * inch]
+            actions_data, colWidths=ACTIONS_TABLE_COL_WIDTHS
         )
-        actions_table_style = TableStyle(
+        actions_table.setStyle(APPENDIX_TABLE_STYLE)
+        elements.extend(
             [
-                (
-                    "BACKGROUND",
-                    (0, 0),
-                    (-1, 0),
-                    colors.HexColor("#2C3E50"),
-                ),  # Blue background for the header row
-                (
-                    "TEXTCOLOR",
-                    (0, 0),
-                    (-1, 0),
-                    colors.whitesmoke,
-                ),  # White text color for the header row
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),  # Left-align text
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),  # Further reduced font size
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 10),  # Added padding
-                ("TOPPADDING", (0, 0), (-1, 0), 10),  # Added padding
-                ("BOTTOMPADDING", (1, 0), (-1, -1), 8),
-                ("TOPPADDING", (1, 0), (-1, -1), 8),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),  # Added padding
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),  # Added padding
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),  # Black grid lines
-                (
-                    "BOX",
-                    (0, 0),
-                    (-1, -1),
-                    0.75,
-                    colors.black,
-                ),  # Thicker border around the table
+                actions_table,
+                Spacer(1, 0.75 * inch),  # Increased spacing
+                PageBreak(),
             ]
         )
 
-        # Manually alternate row background colors for actions table
-        for i in range(1, len(actions_data)):
-            if i % 2 == 0:
-                bg_color = colors.HexColor("#EAECEE")  # Light gray
-            else:
-                bg_color = colors.HexColor("#F2F3F4")
-            actions_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-        actions_table.setStyle(actions_table_style)
-        elements.append(actions_table)
-        elements.append(Spacer(1, 0.75 * inch))  # Increased spacing
-        elements.append(PageBreak())
-
         # -------------------- #
         # Appendix 3: Host-Level Vulnerability Metrics #
         # -------------------- #
@@ -1496,21 +2133,16 @@ def generate_report(
         acs_dict = load_asset_criticality_scores(acs_file_path)
 
         # Appendix: Host-Level Vulnerability Metrics
-        elements.append(Paragraph("Appendix 3: Host-Level Vulnerability Metrics", styleH))
-
-        host_metrics_description = (
-            "This section provides a detailed analysis of vulnerability metrics at the host level. "
-            "Specifically, it includes the median and maximum CVSS (Common Vulnerability Scoring System) scores for each host identified during the assessment. "
-            "The median CVSS score offers a robust average that minimises the impact of outliers, while the maximum CVSS score highlights the most severe vulnerability present on each host. "
-            "By presenting average CVSS scores per host, this section helps prioritise remediation efforts by identifying the most vulnerable systems in the network. "
-            "It offers actionable insights into which hosts require immediate attention based on their overall risk profile."
+        elements.extend(
+            [
+                Paragraph("Appendix 3: Host-Level Vulnerability Metrics", styleH),
+                Paragraph(HOST_METRICS_TEXT, styleN),
+                Spacer(1, 0.25 * inch),
+            ]
         )
 
-        elements.append(Paragraph(host_metrics_description, styleN))
-        elements.append(Spacer(1, 0.25 * inch))
-
-        # Read the CSV file into a DataFrame
-        df_host_metrics = pd.read_csv(csv_path)
+        # Read the columns needed for the host-level metrics from the CSV file
+        df_host_metrics = read_openvas_csv(csv_path, columns=["IP", "CVSS", "Severity"], dtypes=OPENVAS_REPORT_DTYPES)
 
         # Clean the IP column
         df_host_metrics['IP'] = df_host_metrics['IP'].astype(str).str.strip().str.lower()
@@ -1556,27 +2188,9 @@ def generate_report(
             """
             width, height = size
 
-            # Define color mappings for border based on ACS score
-            border_color_mapping = {
-                1: '#264653',
-                2: '#2A9D8F',
-                3: '#E9C46A',
-                4: '#F4A261',
-                5: '#E76f51'
-            }
-
-            # Define text color mappings based on ACS score for optimal contrast
-            text_color_mapping = {
-                1: '#264653',
-                2: '#2A9D8F',
-                3: '#E9C46A',
-                4: '#F4A261',
-                5: '#E76f51'
-            }
-
             # Retrieve the appropriate colors, defaulting to black border and white text if out of range
-            border_color = border_color_mapping.get(score, '#000000')
-            text_color = text_color_mapping.get(score, '#FFFFFF')
+            border_color = ACS_COLORS.get(score, colors.black)
+            text_color = ACS_COLORS.get(score, colors.white)
 
             # Create a Drawing object
             d = Drawing(width, height)
@@ -1611,14 +2225,14 @@ def generate_report(
         # Create the table
         host_metrics_table = Table(
             host_metrics_data,
-            colWidths=[0.5 * inch, 1.3 * inch, 1.1 * inch, 1.1 * inch, 1 * inch, 0.5 * inch, 0.7 * inch, 0.5 * inch],
+            colWidths=HOST_METRICS_TABLE_COL_WIDTHS,
             hAlign='CENTER'
         )
 
         # Apply initial styles
         host_metrics_table_style = TableStyle(
             [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),  # Header row background
+                ("BACKGROUND", (0, 0), (-1, 0), HEADER_BACKGROUND_COLOR),  # Header row background
                 ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),  # Header text color
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),  # Left-align text
                 ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
@@ -1637,12 +2251,11 @@ def generate_report(
             ]
         )
 
-        # Apply styles per row
-        for i in range(1, len(host_metrics_data)):
-            # Alternate row background color
-            bg_color = colors.HexColor("#EAECEE") if i % 2 == 0 else colors.HexColor("#F2F3F4")
-            host_metrics_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
+        # Alternate row background colors
+        add_row_stripes(host_metrics_table_style)
 
+        # Apply styles per row
+        #for i in range(1, len(host_metrics_data)):
             ## Max CVSS styling
             #try:
             #    max_cvss_value = float(host_metrics_data[i][2])
@@ -1690,169 +2303,169 @@ def generate_report(
         #      Heatmap         #
         # -------------------- #
 
-        # Generate the heatmap and save the image
-        try:
-            # Define required columns without 'IP'
-            required_columns = ['Maximum_CVSS', 'Median_CVSS', 'Vulnerability_Count']
-            for col in required_columns:
-                if col not in host_metrics.columns:
-                    host_metrics[col] = 0  # Fill missing columns with zeros
-
-            # Verify 'IP' column exists
-            if 'IP' not in host_metrics.columns:
-                logger.error("The 'IP' column is missing from the host_metrics DataFrame.")
-                raise ValueError("The 'IP' column is required for heatmap generation.")
-
-            # Select the columns you want to include in the heatmap, including 'IP'
-            heatmap_data = host_metrics[['IP'] + required_columns].copy()
-            heatmap_data.set_index('IP', inplace=True)
-
-            # Define color mapping functions
-            def map_cvss_color(value):
-                """
-                Maps CVSS score to color based on defined ranges.
-                """
-                if 0.0 <= value <= 3.9:
-                    return '#3eae49'  # Green
-                elif 4.0 <= value <= 6.9:
-                    return '#fdc432'  # Yellow
-                elif 7.0 <= value <= 10.0:
-                    return '#d43f3a'  # Red
-                else:
-                    return '#FFFFFF'  # White for undefined ranges
-
-            def map_vuln_count_color(value):
-                """
-                Maps Vulnerability Count to color based on defined ranges (same as CVSS).
-                """
-                if 0.0 <= value <= 15:
-                    return '#3eae49'  # Green
-                elif 16 <= value <= 30:
-                    return '#fdc432'  # Yellow
-                elif 31 <= value <= 35:
-                    return '#d43f3a'  # Red
-                elif value > 35:
-                    return '#d43f3a'  # Red for counts above 35
-                else:
-                    return '#FFFFFF'  # White for undefined ranges
-
-            # Create a color array based on the mappings
-            color_array = []
-            for idx, row in heatmap_data.iterrows():
-                row_colors = []
+        # Generate the heatmap and save the image; there is nothing to draw when no host has a CVSS score
+        if not host_metrics.empty:
+            try:
+                # Define required columns without 'IP'
+                required_columns = ['Maximum_CVSS', 'Median_CVSS', 'Vulnerability_Count']
                 for col in required_columns:
-                    if col in ['Maximum_CVSS', 'Median_CVSS']:
-                        try:
-                            color = map_cvss_color(float(row[col]))
-                        except (ValueError, TypeError):
-                            color = '#FFFFFF'  # Default to white if conversion fails
-                    elif col == 'Vulnerability_Count':
-                        try:
-                            color = map_vuln_count_color(float(row[col]))
-                        except (ValueError, TypeError):
-                            color = '#FFFFFF'  # Default to white if conversion fails
+                    if col not in host_metrics.columns:
+                        host_metrics[col] = 0  # Fill missing columns with zeros
+
+                # Verify 'IP' column exists
+                if 'IP' not in host_metrics.columns:
+                    logger.error("The 'IP' column is missing from the host_metrics DataFrame.")
+                    raise ValueError("The 'IP' column is required for heatmap generation.")
+
+                # Select the columns you want to include in the heatmap, including 'IP'
+                heatmap_data = host_metrics[['IP'] + required_columns].copy()
+                heatmap_data.set_index('IP', inplace=True)
+
+                # Define color mapping functions
+                def map_cvss_color(value):
+                    """
+                    Maps CVSS score to color based on defined ranges.
+                    """
+                    if 0.0 <= value <= 3.9:
+                        return '#3eae49'  # Green
+                    elif 4.0 <= value <= 6.9:
+                        return '#fdc432'  # Yellow
+                    elif 7.0 <= value <= 10.0:
+                        return '#d43f3a'  # Red
+                    else:
+                        return '#FFFFFF'  # White for undefined ranges
+
+                def map_vuln_count_color(value):
+                    """
+                    Maps Vulnerability Count to color based on defined ranges (same as CVSS).
+                    """
+                    if 0.0 <= value <= 15:
+                        return '#3eae49'  # Green
+                    elif 16 <= value <= 30:
+                        return '#fdc432'  # Yellow
+                    elif 31 <= value <= 35:
+                        return '#d43f3a'  # Red
+                    elif value > 35:
+                        return '#d43f3a'  # Red for counts above 35
                     else:
-                        color = '#FFFFFF'  # Default to white if column not recognized
-                    row_colors.append(color)
-                color_array.append(row_colors)
-
-            # Convert color array to RGBA
-            rgba_array = []
-            for row in color_array:
-                rgba_row = []
-                for hex_color in row:
-                    try:
-                        rgba = to_rgba(hex_color)
-                    except ValueError:
-                        rgba = to_rgba('#FFFFFF')  # Default to white if invalid color
-                    rgba_row.append(rgba)
-                rgba_array.append(rgba_row)
-
-            rgba_array = np.array(rgba_array)
-
-            # Fixed width and height for heatmap cells
-            fixed_width = 5
-            fixed_height = 5
-
-            # Create plot
-            fig, ax = plt.subplots(figsize=(fixed_width, fixed_height))
-
-            # Display the heatmap with the mapped colors
-            ax.imshow(rgba_array, aspect='auto')
-
-            # Set ticks and labels
-            ax.set_xticks(np.arange(len(required_columns)))
-            ax.set_yticks(np.arange(len(heatmap_data.index)))
-            ax.set_xticklabels(required_columns)
-            ax.set_yticklabels(heatmap_data.index)
-
-            # Rotate the tick labels and set their alignment
-            plt.setp(ax.get_xticklabels(), rotation=45, ha='right', rotation_mode='anchor')
-
-            # Annotate each cell with the actual value
-            for i in range(len(heatmap_data.index)):
-                for j, col_name in enumerate(required_columns):
-                    try:
-                        value = heatmap_data.iloc[i, j]
-                        # Format the text based on the column
-                        if col_name in ['Maximum_CVSS', 'Median_CVSS']:
-                            text = f"{float(value):.1f}"
-                        elif col_name == 'Vulnerability_Count':
-                            text = f"{int(value)}"
+                        return '#FFFFFF'  # White for undefined ranges
+
+                # Create a color array based on the mappings
+                color_array = []
+                for idx, row in heatmap_data.iterrows():
+                    row_colors = []
+                    for col in required_columns:
+                        if col in ['Maximum_CVSS', 'Median_CVSS']:
+                            try:
+                                color = map_cvss_color(float(row[col]))
+                            except (ValueError, TypeError):
+                                color = '#FFFFFF'  # Default to white if conversion fails
+                        elif col == 'Vulnerability_Count':
+                            try:
+                                color = map_vuln_count_color(float(row[col]))
+                            except (ValueError, TypeError):
+                                color = '#FFFFFF'  # Default to white if conversion fails
                         else:
-                            text = str(value)
-                        ax.text(j, i, text, ha='center', va='center', color='black', fontsize=9)
-                    except IndexError:
-                        # Handle cases where the value is missing
-                        ax.text(j, i, "N/A", ha='center', va='center', color='black', fontsize=9)
-                    except ValueError:
-                        # Handle cases where conversion fails
-                        ax.text(j, i, "N/A", ha='center', va='center', color='black', fontsize=9)
-
-            # Set labels and title
-            #ax.set_xlabel('Metrics', fontsize=8)
-            #ax.set_ylabel('Host IP', fontsize=8)
-            ax.set_title('Host-Level Vulnerability Metrics Heatmap', fontsize=10, fontweight='bold')
-
-            # Set minor ticks to draw grid lines
-            ax.set_xticks(np.arange(len(required_columns) + 1) - 0.5, minor=True)
-            ax.set_yticks(np.arange(len(heatmap_data.index) + 1) - 0.5, minor=True)
-            # Enable grid on minor ticks
-            ax.grid(which='minor', color='black', linestyle='-', linewidth=1)
-            # Hide major ticks
-            ax.tick_params(which='minor', bottom=False, left=False)
-            # Optional: Adjust the spines to ensure the grid lines are within the axes
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-
-            # Create legend for CVSS and Vulnerability Count colors
-            legend_elements = [
-                Patch(facecolor='#d43f3a', edgecolor='black', label='High Risk'),  # Red
-                Patch(facecolor='#fdc432', edgecolor='black', label='Medium Risk'),  # Yellow/Orange
-                Patch(facecolor='#3eae49', edgecolor='black', label='Low Risk'),  # Green
-            ]
+                            color = '#FFFFFF'  # Default to white if column not recognized
+                        row_colors.append(color)
+                    color_array.append(row_colors)
+
+                # Convert color array to RGBA
+                rgba_array = []
+                for row in color_array:
+                    rgba_row = []
+                    for hex_color in row:
+                        try:
+                            rgba = to_rgba(hex_color)
+                        except ValueError:
+                            rgba = to_rgba('#FFFFFF')  # Default to white if invalid color
+                        rgba_row.append(rgba)
+                    rgba_array.append(rgba_row)
 
-            ax.legend(handles=legend_elements, bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
+                rgba_array = np.array(rgba_array)
 
-            plt.tight_layout()
+                # Fixed width and height for heatmap cells
+                fixed_width = 5
+                fixed_height = 5
 
-            # Save the heatmap image to the result_graphs directory
-            heatmap_image_path = os.path.join(result_graphs_dir,
-                                              f"{task_name}_host_metrics_heatmap_{completion_time}.png")
-            plt.savefig(heatmap_image_path, bbox_inches='tight', dpi=300)
-            plt.close()
+                # Create plot
+                fig, ax = plt.subplots(figsize=(fixed_width, fixed_height))
 
-            # Add the heatmap image to the PDF
-            elements.append(Spacer(1, 0.25 * inch))
+                # Display the heatmap with the mapped colors
+                ax.imshow(rgba_array, aspect='auto')
 
-            # Create the Image object with fixed width and proportional height, centered
-            heatmap_image = Image(heatmap_image_path, width=fixed_width * inch, height=fixed_height * inch,
-                                  hAlign='CENTER')
-            elements.append(heatmap_image)
-            elements.append(PageBreak())
-        except Exception as e:
-            logger.error(f"Failed to generate heatmap: {e}")
-            print(colored(f"[ERROR] Failed to generate heatmap: {e}", "red"))
+                # Set ticks and labels
+                ax.set_xticks(np.arange(len(required_columns)))
+                ax.set_yticks(np.arange(len(heatmap_data.index)))
+                ax.set_xticklabels(required_columns)
+                ax.set_yticklabels(heatmap_data.index)
+
+                # Rotate the tick labels and set their alignment
+                plt.setp(ax.get_xticklabels(), rotation=45, ha='right', rotation_mode='anchor')
+
+                # Annotate each cell with the actual value
+                for i in range(len(heatmap_data.index)):
+                    for j, col_name in enumerate(required_columns):
+                        try:
+                            value = heatmap_data.iloc[i, j]
+                            # Format the text based on the column
+                            if col_name in ['Maximum_CVSS', 'Median_CVSS']:
+                                text = f"{float(value):.1f}"
+                            elif col_name == 'Vulnerability_Count':
+                                text = f"{int(value)}"
+                            else:
+                                text = str(value)
+                            ax.text(j, i, text, ha='center', va='center', color='black', fontsize=9)
+                        except IndexError:
+                            # Handle cases where the value is missing
+                            ax.text(j, i, "N/A", ha='center', va='center', color='black', fontsize=9)
+                        except ValueError:
+                            # Handle cases where conversion fails
+                            ax.text(j, i, "N/A", ha='center', va='center', color='black', fontsize=9)
+
+                # Set labels and title
+                #ax.set_xlabel('Metrics', fontsize=8)
+                #ax.set_ylabel('Host IP', fontsize=8)
+                ax.set_title('Host-Level Vulnerability Metrics Heatmap', fontsize=10, fontweight='bold')
+
+                # Set minor ticks to draw grid lines
+                ax.set_xticks(np.arange(len(required_columns) + 1) - 0.5, minor=True)
+                ax.set_yticks(np.arange(len(heatmap_data.index) + 1) - 0.5, minor=True)
+                # Enable grid on minor ticks
+                ax.grid(which='minor', color='black', linestyle='-', linewidth=1)
+                # Hide major ticks
+                ax.tick_params(which='minor', bottom=False, left=False)
+                # Optional: Adjust the spines to ensure the grid lines are within the axes
+                for spine in ax.spines.values():
+                    spine.set_visible(False)
+
+                # Create legend for CVSS and Vulnerability Count colors
+                legend_elements = [
+                    Patch(facecolor='#d43f3a', edgecolor='black', label='High Risk'),  # Red
+                    Patch(facecolor='#fdc432', edgecolor='black', label='Medium Risk'),  # Yellow/Orange
+                    Patch(facecolor='#3eae49', edgecolor='black', label='Low Risk'),  # Green
+                ]
+
+                ax.legend(handles=legend_elements, bbox_to_anchor=(1.05, 1), loc='upper left', borderaxespad=0.)
+
+                plt.tight_layout()
+
+                # Save the heatmap image to the result_graphs directory
+                plt.savefig(heatmap_image_path, bbox_inches='tight', dpi=REPORT_CHART_DPI,
+                            pil_kwargs=REPORT_CHART_PNG_OPTIONS)
+                plt.close()
+
+                # Add the heatmap image to the PDF
+                elements.append(Spacer(1, 0.25 * inch))
+
+                # Create the Image object with fixed width and proportional height, centered
+                heatmap_image = Image(heatmap_image_path, width=fixed_width * inch, height=fixed_height * inch,
+                                      hAlign='CENTER')
+                elements.append(heatmap_image)
+                elements.append(PageBreak())
+            except Exception as e:
+                logger.error(f"Failed to generate heatmap: {e}")
+                print(colored(f"[ERROR] Failed to generate heatmap: {e}", "red"))
 
         # -------------------- #
         # Detailed Vulnerabilities #
@@ -1860,34 +2473,34 @@ def generate_report(
 
         # Appendix: Detailed Vulnerability List
         # Extract relevant columns for the detailed vulnerability list
-        detailed_vulns = df[["IP", "DID", "Severity", "Summary", "QoD", "Solution"]].copy()
-
-        # Define the order for the 'Severity' column
-        severity_order = ['High', 'Medium', 'Low']
-        severity_dtype = CategoricalDtype(categories=severity_order, ordered=True)
-        detailed_vulns['Severity'] = detailed_vulns['Severity'].astype(severity_dtype)
+        # 'Log' and unknown severities are already missing values of the categorical 'Severity' column
+        detailed_vulns = df.loc[
+            df['Severity'].notna(), ["IP", "DID", "Severity", "Summary", "QoD", "Solution"]
+        ]
 
-        # Exclude entries with 'Log' severity or any not in the specified categories
-        detailed_vulns = detailed_vulns[detailed_vulns['Severity'].notna()]
+        # Only build the rows and the table when there is something to list
+        if not detailed_vulns.empty:
+            # Sort the DataFrame by 'Severity'
+            detailed_vulns = detailed_vulns.sort_values('Severity')
 
-        # Sort the DataFrame by 'Severity'
-        detailed_vulns = detailed_vulns.sort_values('Severity')
+            # Convert every cell to a string and escape the scan text shown in Paragraphs, one pass per column
+            detailed_vulns = escape_paragraph_columns(detailed_vulns.astype(str), ["IP", "DID", "Summary", "Solution"])
 
-        # Prepare the data for the detailed vulnerabilities table
-        detailed_vulns_data = [["IP", "DID", "Severity", "Summary", "QoD", "Solution"]]
-        for i, row in detailed_vulns.iterrows():
-            detailed_vulns_data.append(
+            # Prepare the data for the detailed vulnerabilities table
+            # Severity and QoD always fit their columns, so they are plain strings drawn in the table font;
+            # the other cells are Paragraphs so long values (IP addresses, 8-digit DIDs, text) wrap
+            detailed_vulns_data = [["IP", "DID", "Severity", "Summary", "QoD", "Solution"]] + [
                 [
-                    Paragraph(str(row["IP"]), styleN),  # IP Address
-                    Paragraph(str(row["DID"])[3:], styleN),  # DID without 'DID' prefix
-                    Paragraph(str(row["Severity"]), styleN),  # Severity
-                    Paragraph(str(row["Summary"]), styleN),  # Summary
-                    Paragraph(str(row["QoD"]), styleN),  # Severity
-                    Paragraph(str(row["Solution"]), styleN),  # Solution
+                    Paragraph(ip, styleN),  # IP Address
+                    Paragraph(did[3:], styleN),  # DID without 'DID' prefix
+                    severity,  # Severity
+                    Paragraph(summary, styleN),  # Summary
+                    qod,  # Quality of Detection
+                    Paragraph(solution, styleN),  # Solution
                 ]
-            )
+                for ip, did, severity, summary, qod, solution in detailed_vulns.itertuples(index=False, name=None)
+            ]
 
-        if detailed_vulns is not None and not detailed_vulns.empty and len(detailed_vulns_data) > 1:
             elements.append(Paragraph("Appendix: Detailed Vulnerability List", styleH))
             detailed_vulnerability_text = (
                 f"The following table outlines all of the {total_vulns} vulnerabilities identified using the scan accompanied by important information "
@@ -1896,211 +2509,26 @@ def generate_report(
             elements.append(Paragraph(detailed_vulnerability_text, styleN))
             elements.append(Spacer(1, 0.25 * inch))
 
-
-            detailed_vulns_table = Table(
-                detailed_vulns_data,
-                colWidths=[1.2 * inch, 0.5 * inch, 0.7 * inch, 1.9 * inch, 0.5 * inch, 1.9 * inch],
-            )
-
-            detailed_vulns_table_style = TableStyle(
-                [
-                    (
-                        "BACKGROUND",
-                        (0, 0),
-                        (-1, 0),
-                        colors.HexColor("#2C3E50"),
-                    ),  # Blue background for the header row
-                    (
-                        "TEXTCOLOR",
-                        (0, 0),
-                        (-1, 0),
-                        colors.whitesmoke,
-                    ),  # White text color for the header row
-                    (
-                        "ALIGN",
-                        (0, 0),
-                        (-1, -1),
-                        "LEFT",
-                    ),  # Left-align text for better readability
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    (
-                        "FONTSIZE",
-                        (0, 0),
-                        (-1, -1),
-                        10,
-                    ),  # Slightly reduced font size for better fit
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 10),  # Added padding
-                    ("TOPPADDING", (0, 0), (-1, 0), 10),  # Added padding
-                    ("BOTTOMPADDING", (1, 0), (-1, -1), 8),
-                    ("TOPPADDING", (1, 0), (-1, -1), 8),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 6),  # Added padding
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 6),  # Added padding
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),  # Black grid lines
-                    (
-                        "BOX",
-                        (0, 0),
-                        (-1, -1),
-                        0.75,
-                        colors.black,
-                    ),  # Thicker border around the table
-                    (
-                        "VALIGN",
-                        (0, 0),
-                        (-1, -1),
-                        "TOP",
-                    ),  # Align text to the top of each cell
-                ]
+            # The list can have thousands of rows, so it is laid out as a series of smaller tables
+            elements.extend(
+                build_chunked_tables(
+                    detailed_vulns_data,
+                    DETAILED_VULNS_TABLE_COL_WIDTHS,
+                    DETAILED_VULNS_TABLE_STYLE,
+                )
             )
-
-            # Manually alternate row background colors
-            for i in range(1, len(detailed_vulns_data)):
-                if i % 2 == 0:
-                    bg_color = colors.HexColor("#EAECEE")  # Light gray
-                else:
-                    bg_color = colors.HexColor("#F2F3F4")
-                detailed_vulns_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-            detailed_vulns_table.setStyle(detailed_vulns_table_style)
-            elements.append(detailed_vulns_table)
             elements.append(Spacer(1, 0.75 * inch))  # Increased spacing
             elements.append(PageBreak())
         else:
-            elements.append(Paragraph("No Detailed Vulnerability List was provided.", styleN))
+            elements.append(Paragraph("No non-informational vulnerabilities were identified.", styleN))
             elements.append(Spacer(1, 0.75 * inch))
 
         # -------------------- #
-        #    Nikto Scan Results#
-        # -------------------- #
-
-        # Appendix: Nikto Scan Results
-        elements.append(Spacer(1, 0.5 * inch))
-        elements.append(Paragraph("Appendix: Nikto Scan Results", styleH))
-        nikto_text = (
-            "The following table presents the results from the Nikto scan, detailing web service/application based vulnerabilities "
-            "identified during the assessment."
-        )
-        elements.append(Paragraph(nikto_text, styleN))
-        elements.append(Spacer(1, 0.25 * inch))
-
-        if nikto_df is not None and not nikto_df.empty:
-            # Prepare Nikto data for the table
-            nikto_table_data = [["Host", "DID", "Port", "Reference", "Description"]]
-            for index, row in nikto_df.iterrows():
-                nikto_table_data.append(
-                    [
-                        Paragraph(str(row["Host"]), styleN),
-                        Paragraph(str(row["DID"])[3:], styleN),
-                        Paragraph(str(row["Port"]), styleN),
-                        Paragraph(str(row["Reference"]), styleN),
-                        Paragraph(str(row["Description"]), styleN),
-                    ]
-                )
-
-            nikto_table = Table(
-                nikto_table_data,
-                colWidths=[1.2 * inch, 0.5 * inch, 0.5 * inch, 1.5 * inch, 3 * inch],
-            )
-
-            nikto_table_style = TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                    ("TOPPADDING", (0, 0), (-1, 0), 10),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
-            )
-
-            # Alternate row colors
-            for i in range(1, len(nikto_table_data)):
-                bg_color = (
-                    colors.HexColor("#EAECEE")
-                    if i % 2 == 0
-                    else colors.HexColor("#F2F3F4")
-                )
-                nikto_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-            nikto_table.setStyle(nikto_table_style)
-            elements.append(nikto_table)
-            elements.append(PageBreak())
-        else:
-            elements.append(Paragraph("No Nikto scan results were provided.", styleN))
-
-        # -------------------- #
-        #   Nuclei Scan Results#
+        # Nikto & Nuclei Results #
         # -------------------- #
 
-        # Appendix: Nuclei Scan Results
-        elements.append(Spacer(1, 0.75 * inch))  # Increased spacing
-        elements.append(Paragraph("Appendix: Nuclei Scan Results", styleH))
-        nuclei_text = (
-            "The following table presents the results from the Nuclei scan, detailing vulnerabilities "
-            "identified during the assessment."
-        )
-        elements.append(Paragraph(nuclei_text, styleN))
-        elements.append(Spacer(1, 0.25 * inch))
-
-        if nuclei_combined_output_file and os.path.exists(nuclei_combined_output_file):
-            with open(nuclei_combined_output_file, "r") as nuclei_file:
-                nuclei_lines = nuclei_file.readlines()
-
-            # Prepare data for the Nuclei table
-            nuclei_table_data = [["Vulnerability", "Protocol", "Severity", "Target"]]
-            for line in nuclei_lines:
-                # Remove any square brackets and extra spaces from the line
-                line = line.replace("[", "").replace("]", "").strip()
-                parts = line.split()  # Split the line into parts
-
-                if len(parts) >= 4:
-                    nuclei_table_data.append(
-                        [
-                            Paragraph(parts[0], styleN),  # Vulnerability
-                            Paragraph(parts[1], styleN),  # Protocol
-                            Paragraph(parts[2], styleN),  # Severity
-                            Paragraph(" ".join(parts[3:]), styleN),  # Target
-                        ]
-                    )
-
-            nuclei_table = Table(
-                nuclei_table_data,
-                colWidths=[1.75 * inch, 1.0 * inch, 1.0 * inch, 2.9 * inch],
-            )
-
-            nuclei_table_style = TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                    ("TOPPADDING", (0, 0), (-1, 0), 10),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
-            )
-
-            # Alternate row colors
-            for i in range(1, len(nuclei_table_data)):
-                bg_color = (
-                    colors.HexColor("#EAECEE")
-                    if i % 2 == 0
-                    else colors.HexColor("#F2F3F4")
-                )
-                nuclei_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-            nuclei_table.setStyle(nuclei_table_style)
-            elements.append(nuclei_table)
-        else:
-            elements.append(Paragraph("No Nuclei scan results were provided.", styleN))
+        elements.extend(build_nikto_appendix(nikto_df))
+        elements.extend(build_nuclei_appendix(nuclei_combined_output_file))
 
         # -------------------- #
         #   Metasploit Results #
@@ -2111,178 +2539,7 @@ def generate_report(
                                               reportname) if reportname is None else os.path.join(
             "metasploit_results", reportname)
 
-        # Parse the Metasploit report
-        if os.path.exists(metasploit_report_path):
-            metasploit_data = parse_metasploit_report(metasploit_report_path)
-        else:
-            metasploit_data = None
-            print(colored(f"[WARNING] Metasploit report not found at path: {metasploit_report_path}", "yellow"))
-
-        # Appendix: Metasploit Exploitation Results
-        if metasploit_data:
-            elements.append(PageBreak())
-            elements.append(Paragraph("Appendix: Metasploit Exploitation Results", styleH))
-            metasploit_intro = (
-                "The following sections detail the results of the Metasploit exploitation attempts conducted during the assessment."
-            )
-            elements.append(Paragraph(metasploit_intro, styleN))
-            elements.append(Spacer(1, 0.25 * inch))
-
-            # Table: Exploited CVEs
-            exploited_cves = metasploit_data.get("exploited_cves", [])
-            if exploited_cves:
-                elements.append(Paragraph("Exploited CVEs:", styleH))
-                metasploit_exp_cve = (
-                    """The table below enumerates the specific CVEs that were successfully exploited during the assessment. 
-                    Each entry provides detailed information about the vulnerability, the exploit utilised, the target IP and port, 
-                    and the number of payloads that were successfully deployed. This data underscores the effectiveness of the 
-                    exploitation efforts and highlights the critical vulnerabilities that require immediate attention."""
-                )
-
-                elements.append(Paragraph(metasploit_exp_cve, styleN))
-                elements.append(Spacer(1, 0.25 * inch))
-                exploited_data = [["CVE", "Exploit (Metasploit Module)", "Target IP", "Target Port", "Payload Successful",]]
-                for exploit in exploited_cves:
-                    exploited_data.append([
-                        Paragraph(exploit.get("cve", "N/A"), styleN),
-                        Paragraph(exploit.get("exploit", "N/A"), styleN),
-                        Paragraph(exploit.get("target_ip", "N/A"), styleN),
-                        Paragraph(exploit.get("target_port", "N/A"), styleN),
-                        Paragraph(str(exploit.get("payload_successful", "N/A")), styleN),
-                    ])
-
-                exploited_table = Table(
-                    exploited_data,
-                    colWidths=[1.2 * inch, 2.1 * inch, 1.2 * inch, 1 * inch, 1.2 * inch]
-                )
-
-                exploited_table_style = TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 8),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                        ("TOPPADDING", (0, 0), (-1, 0), 8),
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                        ("BOX", (0, 0), (-1, -1), 0.75, colors.black),
-                    ]
-                )
-
-                # Alternate row colors
-                for i in range(1, len(exploited_data)):
-                    bg_color = colors.HexColor("#EAECEE") if i % 2 == 0 else colors.HexColor("#F2F3F4")
-                    exploited_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-                exploited_table.setStyle(exploited_table_style)
-                elements.append(exploited_table)
-                elements.append(Spacer(1, 0.25 * inch))
-            else:
-                elements.append(Paragraph("No CVEs were exploited.", styleN))
-                elements.append(Spacer(1, 0.25 * inch))
-
-            # Table: CVEs Without Available Exploits
-            cves_without_exploits = metasploit_data.get("cves_without_exploits", [])
-            if cves_without_exploits:
-                elements.append(Paragraph("CVEs Detected Without Available Exploits:", styleH))
-                metasploit_no_exploit = (
-                    """This section provides a list of CVEs for which have no corresponding Metasploit exploit."""
-                )
-                elements.append(Paragraph(metasploit_no_exploit, styleN))
-                elements.append(Spacer(1, 0.25 * inch))
-                cves_without_exploits_data = [["CVE"]]
-                for cve in cves_without_exploits:
-                    cves_without_exploits_data.append([Paragraph(cve, styleN)])
-
-                cves_without_table = Table(
-                    cves_without_exploits_data,
-                    colWidths=[6.7 * inch]
-                )
-
-                cves_without_table_style = TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 8),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                        ("TOPPADDING", (0, 0), (-1, 0), 8),
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                        ("BOX", (0, 0), (-1, -1), 0.75, colors.black),
-                    ]
-                )
-
-                # Alternate row colors
-                for i in range(1, len(cves_without_exploits_data)):
-                    bg_color = colors.HexColor("#EAECEE") if i % 2 == 0 else colors.HexColor("#F2F3F4")
-                    cves_without_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-                cves_without_table.setStyle(cves_without_table_style)
-                elements.append(cves_without_table)
-                elements.append(Spacer(1, 0.25 * inch))
-            else:
-                elements.append(Paragraph("All detected CVEs have available exploits.", styleN))
-                elements.append(Spacer(1, 0.25 * inch))
-
-            # Summary Statistics
-            if metasploit_data:
-                with open('counts.json', 'r') as f:
-                    counts = json.load(f)
-                exploited_cves = counts.get('exploitedcves', 0)
-                incompatible_cves = counts.get('incompatiblecves', 0)
-                totcve = int(exploited_cves) + int(incompatible_cves)
-
-                elements.append(Paragraph("Summary Statistics:", styleH))
-                metasploit_summary = (
-                    """This table provides a statistical overview of the exploitation module's 
-                    performance. The 'Total CVEs Examined' column shows the number of CVEs that were processed by the 
-                    exploit module. 'Total Exploited CVEs' represents the number of CVEs that were successfully 
-                    exploited, while 'Incompatible CVEs' indicates the number of CVEs for which no corresponding 
-                    Metasploit exploit is available."""
-                )
-                elements.append(Paragraph(metasploit_summary, styleN))
-                elements.append(Spacer(1, 0.25 * inch))
-                summary_data = [
-                    ["Total CVEs Examined", "Total Exploited CVEs", "Incompatible CVEs"],
-                    [
-                        Paragraph(str(totcve), styleN),
-                        Paragraph(str(exploited_cves), styleN),
-                        Paragraph(str(incompatible_cves), styleN),
-                    ]
-                ]
-
-                summary_table = Table(
-                    summary_data,
-                    colWidths=[2.2 * inch, 2.3 * inch, 2.2 * inch]
-                )
-
-                summary_table_style = TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 8),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                        ("TOPPADDING", (0, 0), (-1, 0), 8),
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                        ("BOX", (0, 0), (-1, -1), 0.75, colors.black),
-                    ]
-                )
-
-                # Alternate row colors
-                for i in range(1, len(summary_data)):
-                    bg_color = colors.HexColor("#EAECEE") if i % 2 == 0 else colors.HexColor("#F2F3F4")
-                    summary_table_style.add("BACKGROUND", (0, i), (-1, i), bg_color)
-
-                summary_table.setStyle(summary_table_style)
-                elements.append(summary_table)
-                elements.append(Spacer(1, 0.5 * inch))
-            else:
-                elements.append(Paragraph("Summary Statistics are not available.", styleN))
-                elements.append(Spacer(1, 0.5 * inch))
+        elements.extend(build_metasploit_appendix(metasploit_report_path))
 
         # Build PDF and add page numbers to each page
         doc.build(elements, onFirstPage=add_first_page_header, onLaterPages=add_later_page_number)